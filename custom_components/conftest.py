@@ -0,0 +1,19 @@
+"""Install the Home Assistant stubs before the integration package is imported.
+
+Pytest imports ``entsoe_data/__init__.py`` before the test package's own
+``conftest``, so the stubs have to be registered one directory higher.
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+TEST_DIR = Path(__file__).resolve().parent / "entsoe_data" / "test"
+
+if str(TEST_DIR) not in sys.path:
+    sys.path.append(str(TEST_DIR))
+
+from hass_stubs import install_hass_stubs
+
+install_hass_stubs()
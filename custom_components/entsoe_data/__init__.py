@@ -4,22 +4,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from collections.abc import Iterator, Mapping
+from functools import partial
+from types import MappingProxyType
+from typing import Any, NamedTuple
 
-try:
-    from homeassistant.config_entries import ConfigEntry
-    from homeassistant.const import Platform
-    from homeassistant.core import HomeAssistant
-    from homeassistant.helpers.typing import ConfigType
-except ModuleNotFoundError:  # pragma: no cover - used only in unit tests
-    from .test.hass_stubs import install_hass_stubs
-
-    install_hass_stubs()
-
-    from homeassistant.config_entries import ConfigEntry
-    from homeassistant.const import Platform
-    from homeassistant.core import HomeAssistant
-    from homeassistant.helpers.typing import ConfigType
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_API_KEY,
@@ -38,8 +31,10 @@ from .const import (
     DOMAIN,
     LOAD_FORECAST_HORIZONS,
     TOTAL_EUROPE_AREA,
+    option_enabled,
 )
 from .coordinator import (
+    EntsoeBaseCoordinator,
     EntsoeGenerationCoordinator,
     EntsoeGenerationForecastCoordinator,
     EntsoeLoadCoordinator,
@@ -50,6 +45,83 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS = [Platform.SENSOR]
 
 
+class _CoordinatorSpec(NamedTuple):
+    """Describe one optional coordinator created for a config entry."""
+
+    data_key: str
+    coordinator_class: type[EntsoeBaseCoordinator]
+    option_keys: tuple[str, ...]
+    default: bool
+    europe: bool = False
+    kwargs: Mapping[str, Any] = MappingProxyType({})
+
+
+# Option keys are checked in order: the current key first, then legacy names.
+_COORDINATOR_SPECS: tuple[_CoordinatorSpec, ...] = (
+    _CoordinatorSpec(
+        "generation",
+        EntsoeGenerationCoordinator,
+        (CONF_ENABLE_GENERATION,),
+        DEFAULT_ENABLE_GENERATION,
+    ),
+    _CoordinatorSpec(
+        "generation_forecast",
+        EntsoeGenerationForecastCoordinator,
+        (CONF_ENABLE_GENERATION_FORECAST,),
+        DEFAULT_ENABLE_GENERATION_FORECAST,
+    ),
+    _CoordinatorSpec(
+        "wind_solar_forecast",
+        EntsoeWindSolarForecastCoordinator,
+        (CONF_ENABLE_WIND_SOLAR_FORECAST,),
+        DEFAULT_ENABLE_WIND_SOLAR_FORECAST,
+    ),
+    _CoordinatorSpec(
+        "wind_solar_forecast_europe",
+        EntsoeWindSolarForecastCoordinator,
+        (CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST,),
+        DEFAULT_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
+        europe=True,
+    ),
+    _CoordinatorSpec(
+        "generation_europe",
+        EntsoeGenerationCoordinator,
+        (CONF_ENABLE_EUROPE_GENERATION, CONF_ENABLE_GENERATION_TOTAL_EUROPE),
+        DEFAULT_ENABLE_EUROPE_GENERATION,
+        europe=True,
+    ),
+)
+
+
+def _load_coordinator_specs() -> Iterator[_CoordinatorSpec]:
+    """Yield the local and Total Europe load spec of every forecast horizon."""
+
+    for horizon in LOAD_FORECAST_HORIZONS:
+        kwargs = MappingProxyType(
+            {
+                "process_type": horizon.process_type,
+                "look_ahead": horizon.look_ahead,
+                "update_interval": horizon.update_interval,
+                "horizon": horizon.horizon,
+            }
+        )
+        yield _CoordinatorSpec(
+            horizon.coordinator_key,
+            EntsoeLoadCoordinator,
+            (horizon.option_key,),
+            horizon.default_enabled,
+            kwargs=kwargs,
+        )
+        yield _CoordinatorSpec(
+            horizon.europe_coordinator_key,
+            EntsoeLoadCoordinator,
+            horizon.europe_option_keys,
+            horizon.europe_default_enabled,
+            europe=True,
+            kwargs=kwargs,
+        )
+
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the ENTSO-e integration."""
 
@@ -61,143 +133,86 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     api_key = entry.options[CONF_API_KEY]
     area = entry.options[CONF_AREA]
-    enable_generation = entry.options.get(
-        CONF_ENABLE_GENERATION, DEFAULT_ENABLE_GENERATION
-    )
-    enable_europe_generation = entry.options.get(
-        CONF_ENABLE_EUROPE_GENERATION,
-        entry.options.get(
-            CONF_ENABLE_GENERATION_TOTAL_EUROPE, DEFAULT_ENABLE_EUROPE_GENERATION
-        ),
-    )
-    enable_generation_forecast = entry.options.get(
-        CONF_ENABLE_GENERATION_FORECAST, DEFAULT_ENABLE_GENERATION_FORECAST
-    )
-    enable_wind_solar_forecast = entry.options.get(
-        CONF_ENABLE_WIND_SOLAR_FORECAST, DEFAULT_ENABLE_WIND_SOLAR_FORECAST
-    )
-    enable_europe_wind_solar_forecast = entry.options.get(
-        CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
-        DEFAULT_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
-    )
 
     data: dict[str, Any] = {}
-
-    refresh_tasks: list[Any] = []
-
-    if enable_generation:
-        generation_coordinator = EntsoeGenerationCoordinator(
-            hass,
-            api_key=api_key,
-            area=area,
-        )
-        data["generation"] = generation_coordinator
-        refresh_tasks.append(generation_coordinator.async_config_entry_first_refresh())
-
-    if enable_generation_forecast:
-        generation_forecast_coordinator = EntsoeGenerationForecastCoordinator(
-            hass,
-            api_key=api_key,
-            area=area,
-        )
-        data["generation_forecast"] = generation_forecast_coordinator
-        refresh_tasks.append(
-            generation_forecast_coordinator.async_config_entry_first_refresh()
-        )
-
-    if enable_wind_solar_forecast:
-        wind_solar_forecast_coordinator = EntsoeWindSolarForecastCoordinator(
-            hass,
-            api_key=api_key,
-            area=area,
-        )
-        data["wind_solar_forecast"] = wind_solar_forecast_coordinator
-        refresh_tasks.append(
-            wind_solar_forecast_coordinator.async_config_entry_first_refresh()
-        )
-
-    if enable_europe_wind_solar_forecast:
-        wind_solar_forecast_europe_coordinator = (
-            EntsoeWindSolarForecastCoordinator(
-                hass,
-                api_key=api_key,
-                area=TOTAL_EUROPE_AREA,
-            )
-        )
-        data["wind_solar_forecast_europe"] = (
-            wind_solar_forecast_europe_coordinator
-        )
-        refresh_tasks.append(
-            wind_solar_forecast_europe_coordinator.async_config_entry_first_refresh()
-        )
-
-    if enable_europe_generation:
-        generation_europe_coordinator = EntsoeGenerationCoordinator(
+    for data_key, coordinator_class, option_keys, default, europe, kwargs in (
+        *_COORDINATOR_SPECS,
+        *_load_coordinator_specs(),
+    ):
+        if not option_enabled(entry.options, option_keys, default):
+            continue
+        data[data_key] = coordinator_class(
             hass,
             api_key=api_key,
-            area=TOTAL_EUROPE_AREA,
-        )
-        data["generation_europe"] = generation_europe_coordinator
-        refresh_tasks.append(
-            generation_europe_coordinator.async_config_entry_first_refresh()
-        )
-
-    for horizon in LOAD_FORECAST_HORIZONS:
-        enabled = entry.options.get(horizon.option_key, horizon.default_enabled)
-        if enabled:
-            coordinator = EntsoeLoadCoordinator(
-                hass,
-                api_key=api_key,
-                area=area,
-                process_type=horizon.process_type,
-                look_ahead=horizon.look_ahead,
-                update_interval=horizon.update_interval,
-                horizon=horizon.horizon,
-            )
-            data[horizon.coordinator_key] = coordinator
-            refresh_tasks.append(coordinator.async_config_entry_first_refresh())
-
-        europe_default = horizon.europe_default_enabled
-        for legacy_key in horizon.legacy_europe_option_keys:
-            if legacy_key in entry.options:
-                europe_default = entry.options[legacy_key]
-                break
-
-        europe_enabled = entry.options.get(
-            horizon.europe_option_key,
-            europe_default,
+            area=TOTAL_EUROPE_AREA if europe else area,
+            **kwargs,
         )
 
-        if europe_enabled:
-            coordinator = EntsoeLoadCoordinator(
-                hass,
-                api_key=api_key,
-                area=TOTAL_EUROPE_AREA,
-                process_type=horizon.process_type,
-                look_ahead=horizon.look_ahead,
-                update_interval=horizon.update_interval,
-                horizon=horizon.horizon,
-            )
-            data[horizon.europe_coordinator_key] = coordinator
-            refresh_tasks.append(coordinator.async_config_entry_first_refresh())
-
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = data
+    update_listener = partial(
+        async_update_options, previous_options=dict(entry.options)
+    )
 
-    if refresh_tasks:
-        await asyncio.gather(*refresh_tasks)
+    if not data:
+        # Every dataset is disabled: there is nothing to refresh and no
+        # entity to create, so skip loading the sensor platform entirely.
+        # The update listener still reloads the entry once one is enabled.
+        entry.async_on_unload(entry.add_update_listener(update_listener))
+        return True
+
+    # Wait for every refresh so a failure does not leave the others running
+    # unobserved; each failure is logged and the first one aborts setup.
+    results = await asyncio.gather(
+        *(
+            coordinator.async_config_entry_first_refresh()
+            for coordinator in data.values()
+        ),
+        return_exceptions=True,
+    )
+    errors = [
+        (key, result)
+        for key, result in zip(data, results)
+        if isinstance(result, BaseException)
+    ]
+    if errors:
+        for key, error in errors[1:]:
+            _LOGGER.warning("Initial ENTSO-e %s refresh failed: %s", key, error)
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        for coordinator in data.values():
+            await coordinator.async_shutdown()
+        raise errors[0][1]
+
+    # Platforms are forwarded only once every first refresh has finished:
+    # the sensor platform derives its entities (e.g. generation categories)
+    # from the refreshed data, and a ConfigEntryNotReady raised by a refresh
+    # must abort setup before any platform has been set up.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    entry.async_on_unload(entry.add_update_listener(async_update_options))
+    entry.async_on_unload(entry.add_update_listener(update_listener))
 
     return True
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
+    if not hass.data[DOMAIN].get(entry.entry_id):
+        # Set up without any dataset, so no platform was forwarded.
+        hass.data[DOMAIN].pop(entry.entry_id, None)
+        return True
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinators = hass.data[DOMAIN].pop(entry.entry_id)
+        for coordinator in coordinators.values():
+            await coordinator.async_shutdown()
     return unload_ok
 
 
-async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Update options."""
+async def async_update_options(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    previous_options: Mapping[str, Any] | None = None,
+) -> None:
+    """Reload the entry when its options changed since it was set up."""
+    if previous_options is not None and entry.options == previous_options:
+        # Title-only or no-op saves also fire the listener; skip the reload
+        # and its full refetch from ENTSO-e.
+        return
     await hass.config_entries.async_reload(entry.entry_id)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import enum
+import functools
+import hashlib
 import io
 import logging
 import time
 import zipfile
 import xml.etree.ElementTree as ET
-from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Dict, Union
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Tuple, TypeVar, Union
 
-import pytz
 import requests
 from requests.adapters import HTTPAdapter
 from requests import exceptions as requests_exceptions
@@ -41,6 +42,26 @@ PROCESS_TYPE_WEEK_AHEAD = "A31"
 PROCESS_TYPE_MONTH_AHEAD = "A32"
 PROCESS_TYPE_YEAR_AHEAD = "A33"
 
+# Number of parsed documents kept per client. ENTSO-e frequently returns an
+# identical publication on consecutive hourly polls, so a small cache avoids
+# re-parsing the XML.
+PARSE_CACHE_SIZE = 8
+# Period boundaries repeat across series, documents and polls; a bounded cache
+# of parsed ENTSO-e timestamps covers several weeks of hourly boundaries.
+TIMESTAMP_CACHE_SIZE = 4096
+# Successful responses are reused for identical requests (same document type,
+# domain and hour-aligned period) made shortly after each other, e.g. a manual
+# refresh right after a scheduled poll, skipping the request and its delay.
+RESPONSE_CACHE_SIZE = 32
+RESPONSE_CACHE_TTL = 300.0
+
+ONE_HOUR = timedelta(hours=1)
+
+# Local file header and (empty archive) end-of-central-directory signatures.
+_ZIP_SIGNATURES = (b"PK\x03\x04", b"PK\x05\x06")
+
+_ParsedT = TypeVar("_ParsedT")
+
 PSR_CATEGORY_MAPPING = {
     "B01": "biomass",
     "B02": "coal",
@@ -71,6 +92,53 @@ PSR_CATEGORY_MAPPING = {
     "B27": "coal",
     "B28": "hydro",
 }
+PSR_CATEGORIES_SORTED: tuple[str, ...] = tuple(sorted(set(PSR_CATEGORY_MAPPING.values())))
+
+
+def _memoize_document(
+    parser: Callable[["EntsoeClient", Union[str, bytes]], _ParsedT],
+) -> Callable[["EntsoeClient", Union[str, bytes]], _ParsedT]:
+    """Cache ``parser`` results per client, keyed by a digest of the payload.
+
+    The parsed series is shared between calls, so callers must not mutate it.
+    """
+
+    @functools.wraps(parser)
+    def wrapper(self: "EntsoeClient", document: Union[str, bytes]) -> _ParsedT:
+        payload = document.encode() if isinstance(document, str) else document
+        key = (parser.__name__, hashlib.blake2b(payload, digest_size=16).digest())
+        cache = self._parse_cache
+        try:
+            result = cache[key]
+        except KeyError:
+            result = cache[key] = parser(self, document)
+            if len(cache) > PARSE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return result
+
+    return wrapper
+
+
+def _pivot_category_totals(
+    totals: Dict[Tuple[datetime, str], float], *, ordered: bool = True
+) -> Dict[datetime, Dict[str, float]]:
+    """Turn ``{(timestamp, category): value}`` into nested dicts.
+
+    With ``ordered`` the timestamps and categories are sorted; document
+    parsers skip that because the query that merges them sorts once.
+    """
+
+    result: Dict[datetime, Dict[str, float]] = {}
+    for (timestamp, category), value in (
+        sorted(totals.items()) if ordered else totals.items()
+    ):
+        row = result.get(timestamp)
+        if row is None:
+            row = result[timestamp] = {}
+        row[category] = value
+    return result
 
 
 class EntsoeClient:
@@ -81,19 +149,32 @@ class EntsoeClient:
         self.api_key = api_key
         self._session: requests.Session = requests.Session()
         self._last_request_time: float | None = None
+        self._parse_cache: OrderedDict[tuple[str, bytes], object] = OrderedDict()
+        self._response_cache: OrderedDict[
+            tuple[tuple[str, str], ...], tuple[float, requests.Response]
+        ] = OrderedDict()
         # Enhanced retry configuration to better handle connection errors
         # like RemoteDisconnected that can occur when ENTSO-e servers close connections
         retry = Retry(
             total=5,  # Increased from 3 to handle more transient failures
             connect=5,  # Connection-level retries for RemoteDisconnected errors
             read=5,  # Read-level retries
-            status=5,  # Status-level retries
+            # A single immediate retry on 5xx; _base_request then fails over to
+            # the next ENTSO-e endpoint instead of backing off on a broken one.
+            status=1,
             status_forcelist=(500, 502, 503, 504),
             backoff_factor=2.0,  # Increased from 1.0 for better spacing (2s, 4s, 8s, 16s, 32s)
             allowed_methods=["GET", "HEAD", "OPTIONS"],
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry)
+        # Requests from one client are serialised by the rate limit, so a
+        # single kept-alive connection per ENTSO-e host is all the pool needs.
+        # requests already negotiates gzip/deflate and keep-alive by default.
+        adapter = HTTPAdapter(
+            max_retries=retry,
+            pool_connections=len(BASE_URLS),
+            pool_maxsize=1,
+        )
         self._session.mount("https://", adapter)
         self._session.mount("http://", adapter)
     
@@ -116,6 +197,15 @@ class EntsoeClient:
         }
         params.update(base_params)
 
+        cache_key = tuple(sorted(params.items()))
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() < cached[0]:
+                self._response_cache.move_to_end(cache_key)
+                _LOGGER.debug("Reusing cached ENTSO-e response for %s", params)
+                return cached[1]
+            del self._response_cache[cache_key]
+
         # Apply rate limiting before making the request
         self._apply_rate_limit()
 
@@ -130,6 +220,20 @@ class EntsoeClient:
                     timeout=REQUEST_TIMEOUT,
                 )
                 response.raise_for_status()
+                if response.status_code != 200:
+                    # raise_for_status() only rejects 4xx/5xx responses.
+                    _LOGGER.warning(
+                        "ENTSO-e returned HTTP %s from %s; parsing it as a "
+                        "successful response",
+                        response.status_code,
+                        url,
+                    )
+                self._response_cache[cache_key] = (
+                    time.monotonic() + RESPONSE_CACHE_TTL,
+                    response,
+                )
+                if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                    self._response_cache.popitem(last=False)
                 return response
             except requests_exceptions.HTTPError as exc:
                 status = exc.response.status_code if exc.response is not None else None
@@ -163,20 +267,16 @@ class EntsoeClient:
         raise last_error
 
     def _iter_response_documents(self, response: requests.Response) -> list[bytes]:
-        content_type = response.headers.get("Content-Type", "")
-        treat_as_zip = "zip" in content_type.lower()
+        content_type = response.headers.get("Content-Type", "").lower()
         content = response.content
 
-        buffer = io.BytesIO(content)
-        if not treat_as_zip:
-            treat_as_zip = zipfile.is_zipfile(buffer)
-        if not treat_as_zip:
+        # Plain XML is by far the common case; only wrap the payload for
+        # zipfile when the header or the ZIP signature says it is an archive.
+        if "zip" not in content_type and not content.startswith(_ZIP_SIGNATURES):
             return [content]
 
-        buffer.seek(0)
-
         try:
-            with zipfile.ZipFile(buffer) as archive:
+            with zipfile.ZipFile(io.BytesIO(content)) as archive:
                 members = [name for name in archive.namelist() if not name.endswith("/")]
                 if not members:
                     raise ValueError("Zip archive did not contain any files")
@@ -189,20 +289,37 @@ class EntsoeClient:
             _LOGGER.error("Failed to read ENTSO-e zip response: %s", exc)
             raise ValueError("ENTSO-e response payload is not a valid ZIP archive") from exc
 
-    def _remove_namespace(self, tree):
-        """Remove namespaces in the passed XML tree for easier tag searching."""
-        for elem in tree.iter():
-            # Remove the namespace if present
-            if "}" in elem.tag:
-                elem.tag = elem.tag.split("}", 1)[1]
-        return tree
-
-    def _parse_timestamp(self, value: str) -> datetime:
-        return (
-            datetime.strptime(value, "%Y-%m-%dT%H:%MZ")
-            .replace(tzinfo=pytz.UTC)
-            .astimezone()
-        )
+    def _iter_timeseries(self, document: Union[str, bytes]):
+        """Yield every ``TimeSeries`` of ``document`` with namespaces removed.
+
+        The document is streamed and each series is cleared once the caller has
+        consumed it, so only one series is held in memory at a time. Namespaces
+        are stripped as each element closes, so no subtree is walked twice.
+        """
+        payload = document.encode() if isinstance(document, str) else document
+        for _, elem in ET.iterparse(io.BytesIO(payload)):
+            tag = elem.tag
+            if tag[0] == "{":
+                elem.tag = tag = tag.partition("}")[2]
+            if tag == "TimeSeries":
+                yield elem
+                elem.clear()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=TIMESTAMP_CACHE_SIZE)
+    def _parse_timestamp(value: str) -> datetime:
+        # ENTSO-e timestamps are fixed width ("YYYY-MM-DDTHH:MMZ"), so slicing
+        # avoids strptime's format machinery.
+        if len(value) != 17 or value[16] != "Z":
+            raise ValueError(f"Unsupported ENTSO-e timestamp {value!r}")
+        return datetime(
+            int(value[0:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            tzinfo=timezone.utc,
+        ).astimezone()
 
     def _normalize_resolution(self, resolution: str) -> str:
         if resolution in ("PT60M", "PT1H"):
@@ -214,12 +331,19 @@ class EntsoeClient:
     def _fill_missing_hours(
         self, series: Dict[datetime, float], start_time: datetime, end_time: datetime
     ) -> Dict[datetime, float]:
+        if not series:
+            return series
+
+        # One lookup per hour; series values are never None, so a miss from
+        # ``get`` means the hour is absent.
+        series_get = series.get
         current_time = start_time
-        last_value = series.get(current_time)
+        last_value = series_get(current_time)
 
         while current_time < end_time:
-            if current_time in series:
-                last_value = series[current_time]
+            value = series_get(current_time)
+            if value is not None:
+                last_value = value
             elif last_value is not None:
                 _LOGGER.debug(
                     "Extending value %s of the previous hour to %s",
@@ -227,7 +351,7 @@ class EntsoeClient:
                     current_time,
                 )
                 series[current_time] = last_value
-            current_time += timedelta(hours=1)
+            current_time += ONE_HOUR
 
         return series
 
@@ -253,19 +377,15 @@ class EntsoeClient:
         }
         response = self._base_request(params=params, start=start, end=end)
 
-        if response.status_code == 200:
-            try:
-                series: Dict[datetime, float] = {}
-                for document in self._iter_response_documents(response):
-                    series.update(self.parse_price_document(document))
-                return dict(sorted(series.items()))
-
-            except Exception as exc:
-                _LOGGER.debug(f"Failed to parse response content:{response.content}")
-                raise exc
-        else:
-            print(f"Failed to retrieve data: {response.status_code}")
-            return None
+        try:
+            series: Dict[datetime, float] = {}
+            for document in self._iter_response_documents(response):
+                series.update(self.parse_price_document(document))
+            return dict(sorted(series.items()))
+
+        except Exception:
+            _LOGGER.debug("Failed to parse response content: %s", response.content)
+            raise
 
     def query_generation_per_type(
         self,
@@ -309,25 +429,19 @@ class EntsoeClient:
 
         response = self._base_request(params=params, start=start, end=end)
 
-        if response.status_code == 200:
-            try:
-                generation = defaultdict(lambda: defaultdict(float))
-                for document in self._iter_response_documents(response):
-                    parsed = self.parse_generation_per_type_document(document)
-                    for timestamp, categories in parsed.items():
-                        for category, value in categories.items():
-                            generation[timestamp][category] += float(value)
-
-                result: Dict[datetime, Dict[str, float]] = {}
-                for timestamp in sorted(generation):
-                    result[timestamp] = dict(sorted(generation[timestamp].items()))
-                return result
-            except Exception as exc:
-                _LOGGER.debug(f"Failed to parse response content:{response.content}")
-                raise exc
-        else:
-            print(f"Failed to retrieve data: {response.status_code}")
-            return None
+        try:
+            totals: Dict[Tuple[datetime, str], float] = {}
+            for document in self._iter_response_documents(response):
+                parsed = self.parse_generation_per_type_document(document)
+                for timestamp, categories in parsed.items():
+                    for category, value in categories.items():
+                        key = (timestamp, category)
+                        totals[key] = totals.get(key, 0.0) + float(value)
+
+            return _pivot_category_totals(totals)
+        except Exception:
+            _LOGGER.debug("Failed to parse response content: %s", response.content)
+            raise
 
     def query_total_load_forecast(
         self,
@@ -350,21 +464,17 @@ class EntsoeClient:
 
         response = self._base_request(params=params, start=start, end=end)
 
-        if response.status_code == 200:
-            try:
-                load = defaultdict(float)
-                for document in self._iter_response_documents(response):
-                    parsed = self.parse_total_load_document(document)
-                    for timestamp, value in parsed.items():
-                        load[timestamp] += float(value)
-
-                return {timestamp: load[timestamp] for timestamp in sorted(load)}
-            except Exception as exc:
-                _LOGGER.debug(f"Failed to parse response content:{response.content}")
-                raise exc
-        else:
-            print(f"Failed to retrieve data: {response.status_code}")
-            return None
+        try:
+            load = defaultdict(float)
+            for document in self._iter_response_documents(response):
+                parsed = self.parse_total_load_document(document)
+                for timestamp, value in parsed.items():
+                    load[timestamp] += float(value)
+
+            return {timestamp: load[timestamp] for timestamp in sorted(load)}
+        except Exception:
+            _LOGGER.debug("Failed to parse response content: %s", response.content)
+            raise
 
     def query_generation_forecast(
         self, country_code: Union[Area, str], start: datetime, end: datetime
@@ -384,21 +494,17 @@ class EntsoeClient:
 
         response = self._base_request(params=params, start=start, end=end)
 
-        if response.status_code == 200:
-            try:
-                forecast = defaultdict(float)
-                for document in self._iter_response_documents(response):
-                    parsed = self.parse_generation_forecast_document(document)
-                    for timestamp, value in parsed.items():
-                        forecast[timestamp] += float(value)
-
-                return {timestamp: float(forecast[timestamp]) for timestamp in sorted(forecast)}
-            except Exception as exc:
-                _LOGGER.debug(f"Failed to parse response content:{response.content}")
-                raise exc
-        else:
-            print(f"Failed to retrieve data: {response.status_code}")
-            return None
+        try:
+            forecast = defaultdict(float)
+            for document in self._iter_response_documents(response):
+                parsed = self.parse_generation_forecast_document(document)
+                for timestamp, value in parsed.items():
+                    forecast[timestamp] += float(value)
+
+            return {timestamp: float(forecast[timestamp]) for timestamp in sorted(forecast)}
+        except Exception:
+            _LOGGER.debug("Failed to parse response content: %s", response.content)
+            raise
 
     def query_wind_solar_forecast(
         self, country_code: Union[Area, str], start: datetime, end: datetime
@@ -418,57 +524,48 @@ class EntsoeClient:
 
         response = self._base_request(params=params, start=start, end=end)
 
-        if response.status_code == 200:
-            try:
-                forecast = defaultdict(lambda: defaultdict(float))
-                for document in self._iter_response_documents(response):
-                    parsed = self.parse_wind_solar_document(document)
-                    for timestamp, categories in parsed.items():
-                        for category, value in categories.items():
-                            forecast[timestamp][category] += float(value)
-
-                result: Dict[datetime, Dict[str, float]] = {}
-                for timestamp in sorted(forecast):
-                    result[timestamp] = dict(sorted(forecast[timestamp].items()))
-                return result
-            except Exception as exc:
-                _LOGGER.debug(f"Failed to parse response content:{response.content}")
-                raise exc
-        else:
-            print(f"Failed to retrieve data: {response.status_code}")
-            return None
+        try:
+            totals: Dict[Tuple[datetime, str], float] = {}
+            for document in self._iter_response_documents(response):
+                parsed = self.parse_wind_solar_document(document)
+                for timestamp, categories in parsed.items():
+                    for category, value in categories.items():
+                        key = (timestamp, category)
+                        totals[key] = totals.get(key, 0.0) + float(value)
+
+            return _pivot_category_totals(totals)
+        except Exception:
+            _LOGGER.debug("Failed to parse response content: %s", response.content)
+            raise
 
     # lets process the received document
     def parse_price_document(self, document: Union[str, bytes]) -> Dict[datetime, float]:
 
-        root = self._remove_namespace(ET.fromstring(document))
-        _LOGGER.debug(f"content: {root}")
         series = {}
+        parse_timestamp = self._parse_timestamp
+        normalize_resolution = self._normalize_resolution
 
         # for all given timeseries in this response
         # There may be overlapping times in the repsonse. For now we skip timeseries which we already processed
-        for timeseries in root.findall(".//TimeSeries"):
+        for timeseries in self._iter_timeseries(document):
 
             # for all periods in this timeseries.....-> we still asume the time intervals do not overlap, and are in sequence
-            for period in timeseries.findall(".//Period"):
+            for period in timeseries.iterfind("Period"):
                 # there can be different resolutions for each period (BE casus in which historical is quarterly and future is hourly)
-                resolution_raw = period.find(".//resolution").text
+                resolution_raw = period.find("resolution").text
 
                 try:
-                    resolution = self._normalize_resolution(resolution_raw)
+                    resolution = normalize_resolution(resolution_raw)
                 except ValueError:
                     continue
 
-                start_time = self._parse_timestamp(
-                    period.find(".//timeInterval/start").text
-                )
-                start_time.replace(minute=0)
-
-                end_time = self._parse_timestamp(
-                    period.find(".//timeInterval/end").text
-                )
+                start_time = parse_timestamp(period.find("timeInterval/start").text)
+                end_time = parse_timestamp(period.find("timeInterval/end").text)
                 _LOGGER.debug(
-                    f"Period found is from {start_time} till {end_time} with resolution {resolution}"
+                    "Period found is from %s till %s with resolution %s",
+                    start_time,
+                    end_time,
+                    resolution,
                 )
                 if start_time in series:
                     _LOGGER.debug(
@@ -485,6 +582,25 @@ class EntsoeClient:
 
         return series
 
+    @staticmethod
+    def _iter_points(period, value_tag: str):
+        """Yield ``(position, value)`` for every complete ``Point`` of ``period``.
+
+        Each point's children are scanned once instead of searching it
+        separately for the position and the value.
+        """
+        for point in period.iterfind("Point"):
+            position = value = None
+            for child in point:
+                tag = child.tag
+                if tag == "position":
+                    position = child.text
+                elif tag == value_tag:
+                    value = child.text
+            if position is None or value is None:
+                continue
+            yield int(position), float(value)
+
     # processing hourly prices info -> thats easy
     def process_PT60M_points(
         self,
@@ -494,15 +610,8 @@ class EntsoeClient:
         round_digits: int | None = 2,
     ):
         data: Dict[datetime, float] = {}
-        for point in period.findall(".//Point"):
-            position_text = point.find(".//position")
-            value_element = point.find(f".//{value_tag}")
-
-            if position_text is None or value_element is None:
-                continue
-
-            hour = int(position_text.text) - 1
-            value = float(value_element.text)
+        for position, value in self._iter_points(period, value_tag):
+            hour = position - 1
             if round_digits is not None:
                 value = round(value, round_digits)
             time = start_time + timedelta(hours=hour)
@@ -520,225 +629,113 @@ class EntsoeClient:
         positions: Dict[int, float] = {}
 
         # first store all positions
-        for point in period.findall(".//Point"):
-            position_element = point.find(".//position")
-            value_element = point.find(f".//{value_tag}")
-
-            if position_element is None or value_element is None:
-                continue
-
-            positions[int(position_element.text)] = float(value_element.text)
+        for position, value in self._iter_points(period, value_tag):
+            positions[position] = value
 
         if not positions:
             return {}
 
-        # now calculate hourly averages based on available points
+        # expand to one value per quarter, carrying the last known value
+        # forward over missing positions (ENTSO-e A03 curve type)
+        last_position = (max(positions) + 3) // 4 * 4
+        positions_get = positions.get
+        last_value = positions[min(positions)]
+        quarters: list[float] = []
+        for idx in range(1, last_position + 1):
+            last_value = positions_get(idx, last_value)
+            quarters.append(last_value)
+
+        # now calculate hourly averages from each group of four quarters
         data: Dict[datetime, float] = {}
-        last_hour = (max(positions.keys()) + 3) // 4
-        last_value = positions[min(positions.keys())]
-
-        for hour in range(last_hour):
-            sum_values = 0.0
-            count = 0
-            for idx in range(hour * 4 + 1, hour * 4 + 5):
-                last_value = positions.get(idx, last_value)
-                sum_values += last_value
-                count += 1
-
-            average = sum_values / max(count, 1)
+        for hour, offset in enumerate(range(0, last_position, 4)):
+            average = sum(quarters[offset : offset + 4]) / 4
             if round_digits is not None:
                 average = round(average, round_digits)
 
-            time = start_time + timedelta(hours=hour)
-            data[time] = average
+            data[start_time + timedelta(hours=hour)] = average
 
         return data
 
-    def parse_generation_per_type_document(
-        self, document: Union[str, bytes]
-    ) -> Dict[datetime, Dict[str, float]]:
-        root = self._remove_namespace(ET.fromstring(document))
-        generation = defaultdict(lambda: defaultdict(float))
-
-        for timeseries in root.findall(".//TimeSeries"):
-            psr_type = timeseries.findtext(".//MktPSRType/psrType")
-            category = PSR_CATEGORY_MAPPING.get(psr_type, "other")
+    def _iter_quantities(self, document: Union[str, bytes], *, per_category: bool):
+        """Yield ``(timestamp, category, quantity)`` for every hour of ``document``.
 
-            for period in timeseries.findall(".//Period"):
-                resolution_raw = period.find(".//resolution").text
+        Quarter-hour periods are averaged per hour and gaps inside a period are
+        carried forward. ``category`` is the PSR category of the series when
+        ``per_category`` is set and ``None`` otherwise.
+        """
+        # Resolved once per document rather than once per Period.
+        parse_timestamp = self._parse_timestamp
+        normalize_resolution = self._normalize_resolution
+        fill_missing_hours = self._fill_missing_hours
+        process_hourly = self.process_PT60M_points
+        process_quarterly = self.process_PT15M_points
+
+        for timeseries in self._iter_timeseries(document):
+            category = None
+            if per_category:
+                psr_type = timeseries.findtext("MktPSRType/psrType")
+                category = PSR_CATEGORY_MAPPING.get(psr_type, "other")
+
+            for period in timeseries.iterfind("Period"):
+                resolution_raw = period.find("resolution").text
 
                 try:
-                    resolution = self._normalize_resolution(resolution_raw)
+                    resolution = normalize_resolution(resolution_raw)
                 except ValueError:
                     continue
 
-                start_time = self._parse_timestamp(
-                    period.find(".//timeInterval/start").text
-                )
-                end_time = self._parse_timestamp(period.find(".//timeInterval/end").text)
-
-                if resolution == "PT60M":
-                    points = self.process_PT60M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-                else:
-                    points = self.process_PT15M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
+                start_time = parse_timestamp(period.find("timeInterval/start").text)
+                end_time = parse_timestamp(period.find("timeInterval/end").text)
 
-                points = self._fill_missing_hours(points, start_time, end_time)
+                process = process_hourly if resolution == "PT60M" else process_quarterly
+                points = process(
+                    period, start_time, value_tag="quantity", round_digits=None
+                )
+                points = fill_missing_hours(points, start_time, end_time)
 
                 for timestamp, value in points.items():
-                    generation[timestamp][category] += value
+                    yield timestamp, category, value
 
-        result: Dict[datetime, Dict[str, float]] = {}
-        for timestamp in sorted(generation.keys()):
-            result[timestamp] = dict(sorted(generation[timestamp].items()))
+    def _sum_quantities_per_category(
+        self, document: Union[str, bytes]
+    ) -> Dict[datetime, Dict[str, float]]:
+        totals: Dict[Tuple[datetime, str], float] = {}
+        for timestamp, category, value in self._iter_quantities(
+            document, per_category=True
+        ):
+            key = (timestamp, category)
+            totals[key] = totals.get(key, 0.0) + value
+        return _pivot_category_totals(totals, ordered=False)
 
-        return result
+    def _sum_quantities(self, document: Union[str, bytes]) -> Dict[datetime, float]:
+        totals: Dict[datetime, float] = {}
+        for timestamp, _, value in self._iter_quantities(document, per_category=False):
+            totals[timestamp] = totals.get(timestamp, 0.0) + value
+        return totals
+
+    @_memoize_document
+    def parse_generation_per_type_document(
+        self, document: Union[str, bytes]
+    ) -> Dict[datetime, Dict[str, float]]:
+        return self._sum_quantities_per_category(document)
 
+    @_memoize_document
     def parse_generation_forecast_document(
         self, document: Union[str, bytes]
     ) -> Dict[datetime, float]:
-        root = self._remove_namespace(ET.fromstring(document))
-        forecast = defaultdict(float)
-
-        for timeseries in root.findall(".//TimeSeries"):
-            for period in timeseries.findall(".//Period"):
-                resolution_raw = period.find(".//resolution").text
-
-                try:
-                    resolution = self._normalize_resolution(resolution_raw)
-                except ValueError:
-                    continue
-
-                start_time = self._parse_timestamp(
-                    period.find(".//timeInterval/start").text
-                )
-                end_time = self._parse_timestamp(
-                    period.find(".//timeInterval/end").text
-                )
-
-                if resolution == "PT60M":
-                    points = self.process_PT60M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-                else:
-                    points = self.process_PT15M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-
-                points = self._fill_missing_hours(points, start_time, end_time)
-
-                for timestamp, value in points.items():
-                    forecast[timestamp] += value
-
-        return {timestamp: float(forecast[timestamp]) for timestamp in sorted(forecast)}
+        return self._sum_quantities(document)
 
+    @_memoize_document
     def parse_wind_solar_document(
         self, document: Union[str, bytes]
     ) -> Dict[datetime, Dict[str, float]]:
-        root = self._remove_namespace(ET.fromstring(document))
-        forecast = defaultdict(lambda: defaultdict(float))
-
-        for timeseries in root.findall(".//TimeSeries"):
-            psr_type = timeseries.findtext(".//MktPSRType/psrType")
-            category = PSR_CATEGORY_MAPPING.get(psr_type, "other")
-
-            for period in timeseries.findall(".//Period"):
-                resolution_raw = period.find(".//resolution").text
-
-                try:
-                    resolution = self._normalize_resolution(resolution_raw)
-                except ValueError:
-                    continue
-
-                start_time = self._parse_timestamp(
-                    period.find(".//timeInterval/start").text
-                )
-                end_time = self._parse_timestamp(
-                    period.find(".//timeInterval/end").text
-                )
-
-                if resolution == "PT60M":
-                    points = self.process_PT60M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-                else:
-                    points = self.process_PT15M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-
-                points = self._fill_missing_hours(points, start_time, end_time)
-
-                for timestamp, value in points.items():
-                    forecast[timestamp][category] += value
-
-        result: Dict[datetime, Dict[str, float]] = {}
-        for timestamp in sorted(forecast.keys()):
-            result[timestamp] = dict(sorted(forecast[timestamp].items()))
-
-        return result
+        return self._sum_quantities_per_category(document)
 
+    @_memoize_document
     def parse_total_load_document(
         self, document: Union[str, bytes]
     ) -> Dict[datetime, float]:
-        root = self._remove_namespace(ET.fromstring(document))
-        load = defaultdict(float)
-
-        for timeseries in root.findall(".//TimeSeries"):
-            for period in timeseries.findall(".//Period"):
-                resolution_raw = period.find(".//resolution").text
-
-                try:
-                    resolution = self._normalize_resolution(resolution_raw)
-                except ValueError:
-                    continue
-
-                start_time = self._parse_timestamp(
-                    period.find(".//timeInterval/start").text
-                )
-                end_time = self._parse_timestamp(period.find(".//timeInterval/end").text)
-
-                if resolution == "PT60M":
-                    points = self.process_PT60M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-                else:
-                    points = self.process_PT15M_points(
-                        period,
-                        start_time,
-                        value_tag="quantity",
-                        round_digits=None,
-                    )
-
-                points = self._fill_missing_hours(points, start_time, end_time)
-
-                for timestamp, value in points.items():
-                    load[timestamp] += value
-
-        return {timestamp: load[timestamp] for timestamp in sorted(load.keys())}
+        return self._sum_quantities(document)
 
 
 class Area(enum.Enum):
@@ -757,7 +754,7 @@ class Area(enum.Enum):
         self._tz = tz
 
     def __str__(self):
-        return self.value
+        return self._value_
 
     @property
     def meaning(self):
@@ -769,20 +766,16 @@ class Area(enum.Enum):
 
     @property
     def code(self):
-        return self.value
+        # ``_value_`` is a plain instance attribute; ``value`` goes through
+        # the enum descriptor on every access.
+        return self._value_
 
     @classmethod
     def has_code(cls, code: str) -> bool:
         if not isinstance(code, str):
             return False
 
-        normalized = code.upper()
-
-        return (
-            normalized in cls.__members__
-            or code in cls._value2member_map_
-            or normalized in cls._value2member_map_
-        )
+        return code in _AREA_IDENTIFIERS or code.upper() in _AREA_IDENTIFIERS
 
     @classmethod
     def from_identifier(cls, value: Union["Area", str]) -> "Area":
@@ -794,17 +787,10 @@ class Area(enum.Enum):
         if not isinstance(value, str):
             raise KeyError(f"Unknown area identifier: {value}")
 
-        name = value.upper()
-        if name in cls.__members__:
-            return cls[name]
-
-        if value in cls._value2member_map_:
-            return cls._value2member_map_[value]
-
-        if name in cls._value2member_map_:
-            return cls._value2member_map_[name]
-
-        raise KeyError(f"Unknown area identifier: {value}")
+        area = _AREA_IDENTIFIERS.get(value) or _AREA_IDENTIFIERS.get(value.upper())
+        if area is None:
+            raise KeyError(f"Unknown area identifier: {value}")
+        return area
 
     # List taken directly from the API Docs
     DE_50HZ = (
@@ -1309,3 +1295,13 @@ class Area(enum.Enum):
         "Europe/Rome",
     )
     DE_AMP_LU = "10Y1001C--00002H", "Amprion LU CA", "Europe/Berlin"
+
+
+# Every accepted spelling of an area (member name, EIC code, upper-cased EIC
+# code), resolved once at import. Later entries win, matching the lookup
+# order of ``Area.from_identifier``.
+_AREA_IDENTIFIERS: Dict[str, Area] = {
+    **{code.upper(): area for code, area in Area._value2member_map_.items()},
+    **Area._value2member_map_,
+    **Area.__members__,
+}
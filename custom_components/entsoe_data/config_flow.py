@@ -1,10 +1,10 @@
 """Configuration flow for the ENTSO-e Data integration."""
 
+from collections.abc import Mapping
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.config_entries import (
-    SOURCE_RECONFIGURE,
     ConfigEntry,
     ConfigFlow,
     OptionsFlow,
@@ -14,7 +14,7 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers.selector import SelectOptionDict, SelectSelector, SelectSelectorConfig
 
 from .const import (
-    AREA_INFO,
+    AREA_NAMES,
     COMPONENT_TITLE,
     CONF_API_KEY,
     CONF_AREA,
@@ -34,6 +34,8 @@ from .const import (
     LOAD_FORECAST_OPTION_KEYS,
     LOAD_FORECAST_EUROPE_OPTION_KEYS,
     UNIQUE_ID,
+    UNIQUE_ID_BY_AREA,
+    option_enabled,
 )
 
 
@@ -49,51 +51,48 @@ SENSOR_FLAG_KEYS: tuple[str, ...] = (
     + (CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST,)
 )
 
+# ``(option key, fallback)`` pairs read straight from the stored options; the
+# legacy-aware flags are resolved separately in ``_build_defaults``.
+_DEFAULT_PAIRS: tuple[tuple[str, Any], ...] = (
+    (CONF_API_KEY, ""),
+    (CONF_AREA, None),
+    (CONF_ENABLE_GENERATION, DEFAULT_ENABLE_GENERATION),
+    (CONF_ENABLE_GENERATION_FORECAST, DEFAULT_ENABLE_GENERATION_FORECAST),
+    (CONF_ENABLE_WIND_SOLAR_FORECAST, DEFAULT_ENABLE_WIND_SOLAR_FORECAST),
+    (
+        CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
+        DEFAULT_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
+    ),
+)
+
+# Area choices never change at runtime, so the selector options are built once
+# rather than on every form render. The selector validates (and thereby
+# copies) its config, so sharing the list is safe.
+_AREA_SELECT_OPTIONS: list[SelectOptionDict] = [
+    SelectOptionDict(value=country, label=name)
+    for country, name in AREA_NAMES.items()
+]
+_AREA_SELECTOR = SelectSelector(SelectSelectorConfig(options=_AREA_SELECT_OPTIONS))
+
 
-def _build_defaults(options: dict[str, Any] | None) -> dict[str, Any]:
+def _build_defaults(options: Mapping[str, Any] | None) -> dict[str, Any]:
     """Build default values for the configuration forms."""
 
     options = options or {}
-
-    defaults = {
-        CONF_API_KEY: options.get(CONF_API_KEY, ""),
-        CONF_AREA: options.get(CONF_AREA),
-        CONF_ENABLE_GENERATION: options.get(
-            CONF_ENABLE_GENERATION, DEFAULT_ENABLE_GENERATION
-        ),
-        CONF_ENABLE_GENERATION_FORECAST: options.get(
-            CONF_ENABLE_GENERATION_FORECAST, DEFAULT_ENABLE_GENERATION_FORECAST
-        ),
-        CONF_ENABLE_WIND_SOLAR_FORECAST: options.get(
-            CONF_ENABLE_WIND_SOLAR_FORECAST, DEFAULT_ENABLE_WIND_SOLAR_FORECAST
-        ),
-        CONF_ENABLE_EUROPE_GENERATION: options.get(
-            CONF_ENABLE_EUROPE_GENERATION,
-            options.get(
-                CONF_ENABLE_GENERATION_TOTAL_EUROPE,
-                DEFAULT_ENABLE_EUROPE_GENERATION,
-            ),
-        ),
-        CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST: options.get(
-            CONF_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
-            DEFAULT_ENABLE_EUROPE_WIND_SOLAR_FORECAST,
-        ),
-    }
+    options_get = options.get
+    defaults = {key: options_get(key, fallback) for key, fallback in _DEFAULT_PAIRS}
+    defaults[CONF_ENABLE_EUROPE_GENERATION] = option_enabled(
+        options,
+        (CONF_ENABLE_EUROPE_GENERATION, CONF_ENABLE_GENERATION_TOTAL_EUROPE),
+        DEFAULT_ENABLE_EUROPE_GENERATION,
+    )
 
     for horizon in LOAD_FORECAST_HORIZONS:
-        defaults[horizon.option_key] = options.get(
+        defaults[horizon.option_key] = options_get(
             horizon.option_key, horizon.default_enabled
         )
-
-        europe_default = horizon.europe_default_enabled
-        for legacy_key in horizon.legacy_europe_option_keys:
-            if legacy_key in options:
-                europe_default = options[legacy_key]
-                break
-
-        defaults[horizon.europe_option_key] = options.get(
-            horizon.europe_option_key,
-            europe_default,
+        defaults[horizon.europe_option_key] = option_enabled(
+            options, horizon.europe_option_keys, horizon.europe_default_enabled
         )
 
     return defaults
@@ -105,7 +104,9 @@ def _extract_sensor_values(
     """Extract sensor enable flags from the submitted form data."""
 
     return {
-        option_key: bool(data.get(option_key, defaults[option_key]))
+        option_key: bool(
+            data[option_key] if option_key in data else defaults[option_key]
+        )
         for option_key in SENSOR_FLAG_KEYS
     }
 
@@ -115,29 +116,23 @@ def _build_form_schema(
 ) -> vol.Schema:
     """Construct the schema for the configuration and options forms."""
 
-    api_key_default = (user_input or {}).get(CONF_API_KEY, defaults[CONF_API_KEY])
-    area_default = (user_input or {}).get(CONF_AREA, defaults[CONF_AREA])
+    # The initial render has no input to overlay, so read the defaults as is.
+    form_values = defaults if user_input is None else {**defaults, **user_input}
 
+    api_key_default = form_values[CONF_API_KEY]
     schema: dict[Any, Any] = {
-        vol.Required(CONF_API_KEY, default=api_key_default): vol.All(vol.Coerce(str)),
+        vol.Required(CONF_API_KEY, default=api_key_default): vol.Coerce(str),
     }
 
-    area_field = vol.Required(CONF_AREA)
-    if area_default is not None:
-        area_field = vol.Required(CONF_AREA, default=area_default)
-
-    schema[area_field] = SelectSelector(
-        SelectSelectorConfig(
-            options=[
-                SelectOptionDict(value=country, label=info["name"])
-                for country, info in AREA_INFO.items()
-            ]
-        ),
+    # ``vol.UNDEFINED`` leaves the area without a default, like omitting it.
+    area_default = form_values[CONF_AREA]
+    area_field = vol.Required(
+        CONF_AREA, default=vol.UNDEFINED if area_default is None else area_default
     )
+    schema[area_field] = _AREA_SELECTOR
 
     for option_key in SENSOR_FLAG_KEYS:
-        option_default = (user_input or {}).get(option_key, defaults[option_key])
-        schema[vol.Optional(option_key, default=option_default)] = bool
+        schema[vol.Optional(option_key, default=form_values[option_key])] = bool
 
     return vol.Schema(schema)
 
@@ -159,20 +154,37 @@ class EntsoeFlowHandler(ConfigFlow, domain=DOMAIN):
     ) -> FlowResult:
         """Handle a flow initiated by the user."""
 
-        errors: dict[str, str] = {}
+        return await self._async_step_form("user", None, user_input)
 
-        reconfigure_entry: ConfigEntry | None = None
-        if self.context.get("source") == SOURCE_RECONFIGURE:
-            reconfigure_entry = self.hass.config_entries.async_get_entry(
-                self.context["entry_id"]
-            )
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle reconfiguration of an existing entry."""
 
-        current_options = dict(reconfigure_entry.options) if reconfigure_entry else {}
-        defaults = _build_defaults(current_options)
+        reconfigure_entry = self.hass.config_entries.async_get_entry(
+            self.context["entry_id"]
+        )
+        return await self._async_step_form(
+            "reconfigure", reconfigure_entry, user_input
+        )
+
+    async def _async_step_form(
+        self,
+        step_id: str,
+        reconfigure_entry: ConfigEntry | None,
+        user_input: dict[str, Any] | None,
+    ) -> FlowResult:
+        """Show the configuration form or create/update the entry from it."""
+
+        errors: dict[str, str] = {}
+
+        defaults = _build_defaults(
+            reconfigure_entry.options if reconfigure_entry else None
+        )
 
         if user_input is not None:
             area: str = user_input[CONF_AREA]
-            unique_id = f"{area}_{UNIQUE_ID}"
+            unique_id = UNIQUE_ID_BY_AREA.get(area) or f"{area}_{UNIQUE_ID}"
 
             if reconfigure_entry is None:
                 try:
@@ -181,16 +193,19 @@ class EntsoeFlowHandler(ConfigFlow, domain=DOMAIN):
                 except Exception:  # pragma: no cover - defensive safeguard
                     errors["base"] = "already_configured"
             else:
-                for existing_entry in self._async_current_entries():
-                    if (
-                        existing_entry.entry_id != reconfigure_entry.entry_id
-                        and existing_entry.unique_id == unique_id
-                    ):
-                        errors["base"] = "already_configured"
-                        break
+                existing_entry = (
+                    self.hass.config_entries.async_entry_for_domain_unique_id(
+                        DOMAIN, unique_id
+                    )
+                )
+                if (
+                    existing_entry is not None
+                    and existing_entry.entry_id != reconfigure_entry.entry_id
+                ):
+                    errors["base"] = "already_configured"
 
             if not errors:
-                title = AREA_INFO.get(area, {}).get("name", area)
+                title = AREA_NAMES.get(area, area)
                 sensor_values = _extract_sensor_values(user_input, defaults)
                 options = {
                     CONF_API_KEY: user_input[CONF_API_KEY].strip(),
@@ -218,7 +233,7 @@ class EntsoeFlowHandler(ConfigFlow, domain=DOMAIN):
                 )
 
         return self.async_show_form(
-            step_id="user",
+            step_id=step_id,
             errors=errors,
             data_schema=_build_form_schema(defaults, user_input),
         )
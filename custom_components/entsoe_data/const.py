@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import timedelta
-from typing import Tuple
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
 
 from .api_client import (
     PROCESS_TYPE_DAY_AHEAD,
@@ -65,7 +66,7 @@ LOAD_FORECAST_HORIZON_MONTH_AHEAD = "month_ahead"
 LOAD_FORECAST_HORIZON_YEAR_AHEAD = "year_ahead"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoadForecastHorizonConfig:
     horizon: str
     option_key: str
@@ -83,6 +84,24 @@ class LoadForecastHorizonConfig:
     europe_device_suffix: str
     legacy_europe_option_keys: Tuple[str, ...] = ()
 
+    @property
+    def europe_option_keys(self) -> Tuple[str, ...]:
+        """Return the Total Europe option key followed by its legacy names."""
+        return (self.europe_option_key, *self.legacy_europe_option_keys)
+
+
+def option_enabled(
+    options: Mapping[str, Any], option_keys: Tuple[str, ...], default: bool
+) -> bool:
+    """Return the first of ``option_keys`` set in ``options``, else ``default``.
+
+    Keys are checked in order, so the current option wins over legacy names.
+    """
+    for key in option_keys:
+        if key in options:
+            return options[key]
+    return default
+
 
 LOAD_FORECAST_HORIZONS: Tuple[LoadForecastHorizonConfig, ...] = (
     LoadForecastHorizonConfig(
@@ -164,151 +183,165 @@ LOAD_FORECAST_EUROPE_OPTION_KEYS: Tuple[str, ...] = tuple(
     horizon.europe_option_key for horizon in LOAD_FORECAST_HORIZONS
 )
 
+# Read-only so derived lookups (selector options, name maps) built from it at
+# import time stay valid for the lifetime of the process.
 # Commented ones are not working at entsoe
-AREA_INFO = {
-    TOTAL_EUROPE_AREA: {
-        "code": "10Y1001A1001A876",
-        "name": "Total Europe",
-        "VAT": 0.0,
-        "Currency": "EUR",
-    },
-    "AT": {"code": "AT", "name": "Austria", "VAT": 0.21, "Currency": "EUR"},
-    "BE": {"code": "BE", "name": "Belgium", "VAT": 0.06, "Currency": "EUR"},
-    "BG": {"code": "BG", "name": "Bulgaria", "VAT": 0.21, "Currency": "EUR"},
-    "HR": {"code": "HR", "name": "Croatia", "VAT": 0.21, "Currency": "EUR"},
-    "CZ": {"code": "CZ", "name": "Czech Republic", "VAT": 0.21, "Currency": "EUR"},
-    "DK_1": {
-        "code": "DK_1",
-        "name": "Denmark Western (DK1)",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "DK_2": {
-        "code": "DK_2",
-        "name": "Denmark Eastern (DK2)",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "EE": {"code": "EE", "name": "Estonia", "VAT": 0.21, "Currency": "EUR"},
-    "FI": {"code": "FI", "name": "Finland", "VAT": 0.255, "Currency": "EUR"},
-    "FR": {"code": "FR", "name": "France", "VAT": 0.21, "Currency": "EUR"},
-    "LU": {"code": "DE_LU", "name": "Luxembourg", "VAT": 0.21, "Currency": "EUR"},
-    "DE": {"code": "DE_LU", "name": "Germany", "VAT": 0.21, "Currency": "EUR"},
-    "GR": {"code": "GR", "name": "Greece", "VAT": 0.21, "Currency": "EUR"},
-    "HU": {"code": "HU", "name": "Hungary", "VAT": 0.21, "Currency": "EUR"},
-    "IT_CNOR": {
-        "code": "IT_CNOR",
-        "name": "Italy Centre North",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "IT_CSUD": {
-        "code": "IT_CSUD",
-        "name": "Italy Centre South",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "IT_NORD": {
-        "code": "IT_NORD",
-        "name": "Italy North",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "IT_SUD": {"code": "IT_SUD", "name": "Italy South", "VAT": 0.21, "Currency": "EUR"},
-    "IT_SICI": {
-        "code": "IT_SICI",
-        "name": "Italy Sicilia",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "IT_SARD": {
-        "code": "IT_SARD",
-        "name": "Italy Sardinia",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "IT_CALA": {
-        "code": "IT_CALA",
-        "name": "Italy Calabria",
-        "VAT": 0.21,
-        "Currency": "EUR",
-    },
-    "LV": {"code": "LV", "name": "Latvia", "VAT": 0.21, "Currency": "EUR"},
-    "LT": {"code": "LT", "name": "Lithuania", "VAT": 0.21, "Currency": "EUR"},
-    "NL": {"code": "NL", "name": "Netherlands", "VAT": 0.21, "Currency": "EUR"},
-    "NO_1": {
-        "code": "NO_1",
-        "name": "Norway Oslo (NO1)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "NO_2": {
-        "code": "NO_2",
-        "name": "Norway Kr.Sand (NO2)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "NO_3": {
-        "code": "NO_3",
-        "name": "Norway Tr.heim (NO3)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "NO_4": {
-        "code": "NO_4",
-        "name": "Norway Tromsø (NO4)",
-        "VAT": 0,
-        "Currency": "EUR",
-    },
-    "NO_5": {
-        "code": "NO_5",
-        "name": "Norway Bergen (NO5)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "PL": {"code": "PL", "name": "Poland", "VAT": 0.21, "Currency": "EUR"},
-    "PT": {"code": "PT", "name": "Portugal", "VAT": 0.21, "Currency": "EUR"},
-    "RO": {"code": "RO", "name": "Romania", "VAT": 0.21, "Currency": "EUR"},
-    "RS": {"code": "RS", "name": "Serbia", "VAT": 0.21, "Currency": "EUR"},
-    "SK": {"code": "SK", "name": "Slovakia", "VAT": 0.21, "Currency": "EUR"},
-    "SI": {"code": "SI", "name": "Slovenia", "VAT": 0.21, "Currency": "EUR"},
-    "ES": {"code": "ES", "name": "Spain", "VAT": 0.21, "Currency": "EUR"},
-    "SE_1": {
-        "code": "SE_1",
-        "name": "Sweden Luleå (SE1)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "SE_2": {
-        "code": "SE_2",
-        "name": "Sweden Sundsvall (SE2)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "SE_3": {
-        "code": "SE_3",
-        "name": "Sweden Stockholm (SE3)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "SE_4": {
-        "code": "SE_4",
-        "name": "Sweden Malmö (SE4)",
-        "VAT": 0.25,
-        "Currency": "EUR",
-    },
-    "CH": {"code": "CH", "name": "Switzerland", "VAT": 0.21, "Currency": "EUR"},
-    #  "UK":{"code":"UK", "name":"United Kingdom", "VAT":0.21, "Currency":"EUR"},
-    #  "AL":{"code":"AL", "name":"Albania", "VAT":0.21, "Currency":"EUR"},
-    #  "BA":{"code":"BA", "name":"Bosnia and Herz.", "VAT":0.21, "Currency":"EUR"},
-    #  "CY":{"code":"CY", "name":"Cyprus", "VAT":0.21, "Currency":"EUR"},
-    #  "GE":{"code":"GE", "name":"Georgia", "VAT":0.21, "Currency":"EUR"},
-    #  "IE":{"code":"IE", "name":"Ireland", "VAT":0.21, "Currency":"EUR"},
-    #  "XK":{"code":"XK", "name":"Kosovo", "VAT":0.21, "Currency":"EUR"},
-    #  "MT":{"code":"MT", "name":"Malta", "VAT":0.21, "Currency":"EUR"},
-    #  "MD":{"code":"MD", "name":"Moldova", "VAT":0.21, "Currency":"EUR"},
-    #  "ME":{"code":"ME", "name":"Montenegro", "VAT":0.21, "Currency":"EUR"},
-    #  "MK":{"code":"MK", "name":"North Macedonia", "VAT":0.21, "Currency":"EUR"},
-    #  "TR":{"code":"TR", "name":"Turkey", "VAT":0.21, "Currency":"EUR"},
-    #  "UA":{"code":"UA", "name":"Ukraine", "VAT":0.21, "Currency":"EUR"},
-}
+AREA_INFO: Mapping[str, dict[str, Any]] = MappingProxyType(
+    {
+        TOTAL_EUROPE_AREA: {
+            "code": "10Y1001A1001A876",
+            "name": "Total Europe",
+            "VAT": 0.0,
+            "Currency": "EUR",
+        },
+        "AT": {"code": "AT", "name": "Austria", "VAT": 0.21, "Currency": "EUR"},
+        "BE": {"code": "BE", "name": "Belgium", "VAT": 0.06, "Currency": "EUR"},
+        "BG": {"code": "BG", "name": "Bulgaria", "VAT": 0.21, "Currency": "EUR"},
+        "HR": {"code": "HR", "name": "Croatia", "VAT": 0.21, "Currency": "EUR"},
+        "CZ": {"code": "CZ", "name": "Czech Republic", "VAT": 0.21, "Currency": "EUR"},
+        "DK_1": {
+            "code": "DK_1",
+            "name": "Denmark Western (DK1)",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "DK_2": {
+            "code": "DK_2",
+            "name": "Denmark Eastern (DK2)",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "EE": {"code": "EE", "name": "Estonia", "VAT": 0.21, "Currency": "EUR"},
+        "FI": {"code": "FI", "name": "Finland", "VAT": 0.255, "Currency": "EUR"},
+        "FR": {"code": "FR", "name": "France", "VAT": 0.21, "Currency": "EUR"},
+        "LU": {"code": "DE_LU", "name": "Luxembourg", "VAT": 0.21, "Currency": "EUR"},
+        "DE": {"code": "DE_LU", "name": "Germany", "VAT": 0.21, "Currency": "EUR"},
+        "GR": {"code": "GR", "name": "Greece", "VAT": 0.21, "Currency": "EUR"},
+        "HU": {"code": "HU", "name": "Hungary", "VAT": 0.21, "Currency": "EUR"},
+        "IT_CNOR": {
+            "code": "IT_CNOR",
+            "name": "Italy Centre North",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "IT_CSUD": {
+            "code": "IT_CSUD",
+            "name": "Italy Centre South",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "IT_NORD": {
+            "code": "IT_NORD",
+            "name": "Italy North",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "IT_SUD": {"code": "IT_SUD", "name": "Italy South", "VAT": 0.21, "Currency": "EUR"},
+        "IT_SICI": {
+            "code": "IT_SICI",
+            "name": "Italy Sicilia",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "IT_SARD": {
+            "code": "IT_SARD",
+            "name": "Italy Sardinia",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "IT_CALA": {
+            "code": "IT_CALA",
+            "name": "Italy Calabria",
+            "VAT": 0.21,
+            "Currency": "EUR",
+        },
+        "LV": {"code": "LV", "name": "Latvia", "VAT": 0.21, "Currency": "EUR"},
+        "LT": {"code": "LT", "name": "Lithuania", "VAT": 0.21, "Currency": "EUR"},
+        "NL": {"code": "NL", "name": "Netherlands", "VAT": 0.21, "Currency": "EUR"},
+        "NO_1": {
+            "code": "NO_1",
+            "name": "Norway Oslo (NO1)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "NO_2": {
+            "code": "NO_2",
+            "name": "Norway Kr.Sand (NO2)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "NO_3": {
+            "code": "NO_3",
+            "name": "Norway Tr.heim (NO3)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "NO_4": {
+            "code": "NO_4",
+            "name": "Norway Tromsø (NO4)",
+            "VAT": 0,
+            "Currency": "EUR",
+        },
+        "NO_5": {
+            "code": "NO_5",
+            "name": "Norway Bergen (NO5)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "PL": {"code": "PL", "name": "Poland", "VAT": 0.21, "Currency": "EUR"},
+        "PT": {"code": "PT", "name": "Portugal", "VAT": 0.21, "Currency": "EUR"},
+        "RO": {"code": "RO", "name": "Romania", "VAT": 0.21, "Currency": "EUR"},
+        "RS": {"code": "RS", "name": "Serbia", "VAT": 0.21, "Currency": "EUR"},
+        "SK": {"code": "SK", "name": "Slovakia", "VAT": 0.21, "Currency": "EUR"},
+        "SI": {"code": "SI", "name": "Slovenia", "VAT": 0.21, "Currency": "EUR"},
+        "ES": {"code": "ES", "name": "Spain", "VAT": 0.21, "Currency": "EUR"},
+        "SE_1": {
+            "code": "SE_1",
+            "name": "Sweden Luleå (SE1)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "SE_2": {
+            "code": "SE_2",
+            "name": "Sweden Sundsvall (SE2)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "SE_3": {
+            "code": "SE_3",
+            "name": "Sweden Stockholm (SE3)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "SE_4": {
+            "code": "SE_4",
+            "name": "Sweden Malmö (SE4)",
+            "VAT": 0.25,
+            "Currency": "EUR",
+        },
+        "CH": {"code": "CH", "name": "Switzerland", "VAT": 0.21, "Currency": "EUR"},
+        #  "UK":{"code":"UK", "name":"United Kingdom", "VAT":0.21, "Currency":"EUR"},
+        #  "AL":{"code":"AL", "name":"Albania", "VAT":0.21, "Currency":"EUR"},
+        #  "BA":{"code":"BA", "name":"Bosnia and Herz.", "VAT":0.21, "Currency":"EUR"},
+        #  "CY":{"code":"CY", "name":"Cyprus", "VAT":0.21, "Currency":"EUR"},
+        #  "GE":{"code":"GE", "name":"Georgia", "VAT":0.21, "Currency":"EUR"},
+        #  "IE":{"code":"IE", "name":"Ireland", "VAT":0.21, "Currency":"EUR"},
+        #  "XK":{"code":"XK", "name":"Kosovo", "VAT":0.21, "Currency":"EUR"},
+        #  "MT":{"code":"MT", "name":"Malta", "VAT":0.21, "Currency":"EUR"},
+        #  "MD":{"code":"MD", "name":"Moldova", "VAT":0.21, "Currency":"EUR"},
+        #  "ME":{"code":"ME", "name":"Montenegro", "VAT":0.21, "Currency":"EUR"},
+        #  "MK":{"code":"MK", "name":"North Macedonia", "VAT":0.21, "Currency":"EUR"},
+        #  "TR":{"code":"TR", "name":"Turkey", "VAT":0.21, "Currency":"EUR"},
+        #  "UA":{"code":"UA", "name":"Ukraine", "VAT":0.21, "Currency":"EUR"},
+    }
+)
+
+# Display name per area key, for titles and sensor attributes.
+AREA_NAMES: Mapping[str, str] = MappingProxyType(
+    {area: info["name"] for area, info in AREA_INFO.items()}
+)
+
+# Config entry unique id per area key.
+UNIQUE_ID_BY_AREA: Mapping[str, str] = MappingProxyType(
+    {area: f"{area}_{UNIQUE_ID}" for area in AREA_INFO}
+)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import logging
+import math
+import time
+from bisect import bisect_right
 from collections import defaultdict
-from datetime import datetime, timedelta
-from typing import Any, Iterable
+from datetime import datetime, timedelta, timezone
+from functools import cached_property
+from typing import Any, Callable, Hashable, Iterable
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers import event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt
 from requests import exceptions as requests_exceptions
@@ -29,10 +34,50 @@ from .const import (
     TOTAL_EUROPE_AREA,
 )
 
+_SECONDS_PER_HOUR = 3600
+
+
+def _next_hour() -> datetime:
+    """Return the start of the next UTC hour."""
+
+    # Floor the epoch to the hour instead of building an aware ``now`` and
+    # replacing its fields; the boundary is the same in UTC and any zone
+    # with a whole-hour offset.
+    return datetime.fromtimestamp(
+        (int(time.time()) // _SECONDS_PER_HOUR + 1) * _SECONDS_PER_HOUR,
+        timezone.utc,
+    )
+
+
+def _category_timelines(
+    data: dict[datetime, dict[str, float]], timestamps: Iterable[datetime]
+) -> dict[str, dict[str, float]]:
+    """Split ``{timestamp: {category: value}}`` into one timeline per category."""
+
+    columns: defaultdict[str, dict[str, float]] = defaultdict(dict)
+    for timestamp in timestamps:
+        label = timestamp.isoformat()
+        for category, value in data[timestamp].items():
+            columns[category][label] = float(value)
+    return dict(columns)
+
 
 class EntsoeBaseCoordinator(DataUpdateCoordinator[dict]):
     """Base coordinator providing helper selection utilities."""
 
+    _data: Any = None
+    # Bumped on every ``data`` assignment so derived values can be memoised.
+    timeline_version: int = 0
+    _sorted_cache: tuple[int, list[datetime]] | None = None
+    # (version, lower bound, upper bound, current, next) for the last lookup
+    # against the wall clock; valid while ``lower <= now < upper``.
+    _window_cache: tuple[
+        int, datetime | None, datetime | None, datetime | None, datetime | None
+    ] | None = None
+    _timeline_cache: tuple[int, Any] | None = None
+    _area_timeline_cache: tuple[int, Any] | None = None
+    _unsub_hourly: Callable[[], None] | None = None
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -47,6 +92,85 @@ class EntsoeBaseCoordinator(DataUpdateCoordinator[dict]):
         ] = {}
         self._last_total_europe_fallback: dict[str, bool] = {}
         self._last_total_europe_no_data: dict[str, bool] = {}
+        self._hourly_listeners: list[Callable[[], None]] = []
+
+    @property
+    def data(self) -> Any:
+        return self._data
+
+    @data.setter
+    def data(self, value: Any) -> None:
+        self._data = value
+        self.timeline_version += 1
+        self._attributes_cache: dict[
+            Hashable, tuple[tuple[datetime | None, datetime | None], dict[str, Any]]
+        ] = {}
+
+    def cached_attributes(
+        self, key: Hashable, builder: Callable[[], dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Return ``builder()``, reusing the last result for ``key``.
+
+        The cached dict is dropped whenever ``data`` is replaced or the
+        current/next timestamps move on, so callers must treat it as
+        read-only: sensors sharing a key share the same dict.
+        """
+
+        marker = self._timestamp_window()
+        cached = self._attributes_cache.get(key)
+        if cached is not None and cached[0] == marker:
+            return cached[1]
+        attrs = builder()
+        self._attributes_cache[key] = (marker, attrs)
+        return attrs
+
+    async def async_shutdown(self) -> None:
+        """Stop the coordinator and its hourly timer."""
+
+        await super().async_shutdown()
+        self._cancel_hourly_tick()
+
+    @callback
+    def async_add_hourly_listener(
+        self, update_callback: Callable[[], None]
+    ) -> Callable[[], None]:
+        """Call ``update_callback`` at the top of every hour until removed.
+
+        Listeners share one timer, so the loop wakes once per hour for the
+        coordinator rather than once per sensor.
+        """
+
+        self._hourly_listeners.append(update_callback)
+        if self._unsub_hourly is None:
+            self._schedule_hourly_tick()
+
+        @callback
+        def remove_listener() -> None:
+            self._hourly_listeners.remove(update_callback)
+            if not self._hourly_listeners:
+                self._cancel_hourly_tick()
+
+        return remove_listener
+
+    @cached_property
+    def _hourly_job(self) -> HassJob:
+        return HassJob(self._handle_hourly_tick)
+
+    def _schedule_hourly_tick(self) -> None:
+        self._unsub_hourly = event.async_track_point_in_utc_time(
+            self.hass, self._hourly_job, _next_hour()
+        )
+
+    def _cancel_hourly_tick(self) -> None:
+        if self._unsub_hourly is not None:
+            self._unsub_hourly()
+            self._unsub_hourly = None
+
+    @callback
+    def _handle_hourly_tick(self, _now: datetime) -> None:
+        self._schedule_hourly_tick()
+        for update_callback in list(self._hourly_listeners):
+            update_callback()
 
     def _copy_data(self) -> dict[datetime, Any]:
         if not self.data:
@@ -86,7 +210,45 @@ class EntsoeBaseCoordinator(DataUpdateCoordinator[dict]):
     def _sorted_timestamps(self) -> list[datetime]:
         if not self.data:
             return []
-        return sorted(self.data.keys())
+        cached = self._sorted_cache
+        if cached is None or cached[0] != self.timeline_version:
+            cached = self._sorted_cache = (
+                self.timeline_version,
+                sorted(self.data.keys()),
+            )
+        return cached[1]
+
+    def _timelines(self) -> Any:
+        """Return ``_build_timelines()``, rebuilt only when ``data`` changes."""
+
+        cached = self._timeline_cache
+        if cached is None or cached[0] != self.timeline_version:
+            cached = self._timeline_cache = (
+                self.timeline_version,
+                self._build_timelines() if self.data else {},
+            )
+        return cached[1]
+
+    def _build_timelines(self) -> Any:
+        raise NotImplementedError
+
+    def _area_timelines(self) -> Any:
+        """Return ``_build_area_timelines()``, rebuilt only when ``data`` changes.
+
+        ``_area_data`` is filled by the same update that assigns ``data``, so
+        the data version also tracks the per-area series.
+        """
+
+        cached = self._area_timeline_cache
+        if cached is None or cached[0] != self.timeline_version:
+            cached = self._area_timeline_cache = (
+                self.timeline_version,
+                self._build_area_timelines(),
+            )
+        return cached[1]
+
+    def _build_area_timelines(self) -> Any:
+        return {}
 
     def _format_area_names(self, areas: Iterable[str]) -> str:
         names: list[str] = []
@@ -227,25 +389,44 @@ class EntsoeBaseCoordinator(DataUpdateCoordinator[dict]):
 
         return time_since_update > staleness_threshold
 
-    def _select_current_timestamp(self, reference: datetime | None = None) -> datetime | None:
+    def _timestamp_window(
+        self, reference: datetime | None = None
+    ) -> tuple[datetime | None, datetime | None]:
+        """Return the ``(current, next)`` timestamps around ``reference``.
+
+        The result for the wall clock is cached until the data changes or the
+        clock crosses the next timestamp, so every sensor of a coordinator
+        shares one lookup per hour.
+        """
+
         ref = self._reference_time(reference)
-        for timestamp in reversed(self._sorted_timestamps()):
-            if timestamp <= ref:
-                return timestamp
-        # If no timestamp <= ref found (all timestamps are in the future),
-        # return the nearest future timestamp (first in sorted list)
-        # This is useful for forecast data where all values are future-dated
+        cached = self._window_cache
+        if (
+            reference is None
+            and cached is not None
+            and cached[0] == self.timeline_version
+            and (cached[1] is None or cached[1] <= ref)
+            and (cached[2] is None or ref < cached[2])
+        ):
+            return cached[3], cached[4]
+
         timestamps = self._sorted_timestamps()
-        if timestamps:
-            return timestamps[0]
-        return None
+        index = bisect_right(timestamps, ref)
+        lower = timestamps[index - 1] if index else None
+        upper = timestamps[index] if index < len(timestamps) else None
+        # If no timestamp <= ref exists (all timestamps are in the future),
+        # use the nearest future timestamp as current. This is useful for
+        # forecast data where all values are future-dated.
+        current = lower if lower is not None else upper
+        if reference is None:
+            self._window_cache = (self.timeline_version, lower, upper, current, upper)
+        return current, upper
+
+    def _select_current_timestamp(self, reference: datetime | None = None) -> datetime | None:
+        return self._timestamp_window(reference)[0]
 
     def _select_next_timestamp(self, reference: datetime | None = None) -> datetime | None:
-        ref = self._reference_time(reference)
-        for timestamp in self._sorted_timestamps():
-            if timestamp > ref:
-                return timestamp
-        return None
+        return self._timestamp_window(reference)[1]
 
     def current_timestamp(self, reference: datetime | None = None) -> datetime | None:
         return self._select_current_timestamp(reference)
@@ -341,19 +522,20 @@ class EntsoeGenerationCoordinator(EntsoeBaseCoordinator):
         normalized: dict[datetime, dict[str, float]] = {}
         categories: set[str] = set()
         for timestamp, values in response.items():
-            normalized_values: dict[str, float] = defaultdict(float)
-            total = 0.0
-            for category, value in values.items():
-                normalized_values[category] += value
-                total += value
-            normalized_values[self._total_key] = total
-            normalized[timestamp] = dict(normalized_values)
-            categories.update(normalized_values.keys())
+            normalized[timestamp] = row = self._with_total(values)
+            categories.update(row)
 
         self._available_categories = categories
         self.last_successful_update = dt.now()
         return normalized
 
+    def _with_total(self, values: dict[str, float]) -> dict[str, float]:
+        """Return a copy of ``values`` including the summed total generation."""
+
+        row = dict(values)
+        row[self._total_key] = math.fsum(values.values())
+        return row
+
     def _query_total_europe_generation(
         self, start: datetime, end: datetime
     ) -> tuple[dict[datetime, dict[str, float]], set[str], set[str]]:
@@ -404,8 +586,12 @@ class EntsoeGenerationCoordinator(EntsoeBaseCoordinator):
                     recovered_this_run.append(area_key)
                     self._area_last_suppressed[area_key] = None
 
-                # Store per-area data for individual sensors
-                self._area_data[area_key] = response
+                # Store per-area data for individual sensors, with the total
+                # precomputed so per-area total sensors read it directly.
+                self._area_data[area_key] = {
+                    timestamp: self._with_total(values)
+                    for timestamp, values in response.items()
+                }
 
                 has_non_zero = False
                 for timestamp, values in response.items():
@@ -465,15 +651,11 @@ class EntsoeGenerationCoordinator(EntsoeBaseCoordinator):
             return None
         return self.data.get(timestamp, {}).get(category)
 
+    def _build_timelines(self) -> dict[str, dict[str, float]]:
+        return _category_timelines(self.data, self._sorted_timestamps())
+
     def timeline(self, category: str) -> dict[str, float]:
-        if not self.data:
-            return {}
-        timeline: dict[str, float] = {}
-        for timestamp, values in sorted(self.data.items()):
-            if category not in values:
-                continue
-            timeline[timestamp.isoformat()] = float(values[category])
-        return timeline
+        return self._timelines().get(category, {})
 
     def get_area_keys(self) -> list[str]:
         """Return list of areas with available data."""
@@ -499,14 +681,17 @@ class EntsoeGenerationCoordinator(EntsoeBaseCoordinator):
             timeline[timestamp.isoformat()] = float(values[category])
         return timeline
 
+    def _build_area_timelines(self) -> dict[str, dict[str, dict[str, float]]]:
+        result: defaultdict[str, dict[str, dict[str, float]]] = defaultdict(dict)
+        for area_key, area_data in self._area_data.items():
+            timelines = _category_timelines(area_data, sorted(area_data))
+            for category, timeline in timelines.items():
+                result[category][area_key] = timeline
+        return dict(result)
+
     def get_all_area_timelines(self, category: str) -> dict[str, dict[str, float]]:
         """Get timelines for all areas for a specific category."""
-        result: dict[str, dict[str, float]] = {}
-        for area_key in self._area_data:
-            timeline = self.get_area_timeline(area_key, category)
-            if timeline:
-                result[area_key] = timeline
-        return result
+        return self._area_timelines().get(category, {})
 
 
 class EntsoeLoadCoordinator(EntsoeBaseCoordinator):
@@ -767,17 +952,18 @@ class EntsoeLoadCoordinator(EntsoeBaseCoordinator):
     def average_value(self) -> float | None:
         if not self.data:
             return None
-        values = list(self.data.values())
-        return float(sum(values) / len(values))
+        return float(sum(self.data.values()) / len(self.data))
 
-    def timeline(self) -> dict[str, float]:
-        if not self.data:
-            return {}
+    def _build_timelines(self) -> dict[str, float]:
+        data = self.data
         return {
-            timestamp.isoformat(): float(value)
-            for timestamp, value in sorted(self.data.items())
+            timestamp.isoformat(): float(data[timestamp])
+            for timestamp in self._sorted_timestamps()
         }
 
+    def timeline(self) -> dict[str, float]:
+        return self._timelines()
+
     def get_area_keys(self) -> list[str]:
         """Return list of areas with available data."""
         return sorted(self._area_data.keys())
@@ -800,8 +986,7 @@ class EntsoeLoadCoordinator(EntsoeBaseCoordinator):
             for timestamp, value in sorted(self._area_data[area_key].items())
         }
 
-    def get_all_area_timelines(self) -> dict[str, dict[str, float]]:
-        """Get timelines for all areas."""
+    def _build_area_timelines(self) -> dict[str, dict[str, float]]:
         result: dict[str, dict[str, float]] = {}
         for area_key in self._area_data:
             timeline = self.get_area_timeline(area_key)
@@ -809,6 +994,10 @@ class EntsoeLoadCoordinator(EntsoeBaseCoordinator):
                 result[area_key] = timeline
         return result
 
+    def get_all_area_timelines(self) -> dict[str, dict[str, float]]:
+        """Get timelines for all areas."""
+        return self._area_timelines()
+
 
 class EntsoeGenerationForecastCoordinator(EntsoeBaseCoordinator):
     """Coordinator handling generation forecast queries."""
@@ -951,17 +1140,18 @@ class EntsoeGenerationForecastCoordinator(EntsoeBaseCoordinator):
     def average_value(self) -> float | None:
         if not self.data:
             return None
-        values = list(self.data.values())
-        return float(sum(values) / len(values))
+        return float(sum(self.data.values()) / len(self.data))
 
-    def timeline(self) -> dict[str, float]:
-        if not self.data:
-            return {}
+    def _build_timelines(self) -> dict[str, float]:
+        data = self.data
         return {
-            timestamp.isoformat(): float(value)
-            for timestamp, value in sorted(self.data.items())
+            timestamp.isoformat(): float(data[timestamp])
+            for timestamp in self._sorted_timestamps()
         }
 
+    def timeline(self) -> dict[str, float]:
+        return self._timelines()
+
 
 class EntsoeWindSolarForecastCoordinator(EntsoeBaseCoordinator):
     """Coordinator handling wind and solar forecast queries."""
@@ -1168,15 +1358,11 @@ class EntsoeWindSolarForecastCoordinator(EntsoeBaseCoordinator):
             return None
         return self.data.get(timestamp, {}).get(category)
 
+    def _build_timelines(self) -> dict[str, dict[str, float]]:
+        return _category_timelines(self.data, self._sorted_timestamps())
+
     def timeline(self, category: str) -> dict[str, float]:
-        if not self.data:
-            return {}
-        timeline: dict[str, float] = {}
-        for timestamp, values in sorted(self.data.items()):
-            if category not in values:
-                continue
-            timeline[timestamp.isoformat()] = float(values[category])
-        return timeline
+        return self._timelines().get(category, {})
 
     def get_area_keys(self) -> list[str]:
         """Return list of areas with available data."""
@@ -1202,11 +1388,14 @@ class EntsoeWindSolarForecastCoordinator(EntsoeBaseCoordinator):
             timeline[timestamp.isoformat()] = float(values[category])
         return timeline
 
+    def _build_area_timelines(self) -> dict[str, dict[str, dict[str, float]]]:
+        result: defaultdict[str, dict[str, dict[str, float]]] = defaultdict(dict)
+        for area_key, area_data in self._area_data.items():
+            timelines = _category_timelines(area_data, sorted(area_data))
+            for category, timeline in timelines.items():
+                result[category][area_key] = timeline
+        return dict(result)
+
     def get_all_area_timelines(self, category: str) -> dict[str, dict[str, float]]:
         """Get timelines for all areas for a specific category."""
-        result: dict[str, dict[str, float]] = {}
-        for area_key in self._area_data:
-            timeline = self.get_area_timeline(area_key, category)
-            if timeline:
-                result[area_key] = timeline
-        return result
+        return self._area_timelines().get(category, {})
@@ -3,27 +3,31 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from bisect import insort
+from collections.abc import Callable, Iterable, Mapping
 from dataclasses import dataclass, replace
-from datetime import timedelta
-from typing import Any
+from functools import cache, lru_cache, partial, wraps
+from operator import methodcaller
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import (
     RestoreSensor,
     SensorEntityDescription,
     SensorStateClass,
 )
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HassJob, HomeAssistant
-from homeassistant.helpers import event
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.util import utcnow
 
+if TYPE_CHECKING:
+    # Only needed for annotations, which are not evaluated at runtime.
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
+
+from .api_client import PSR_CATEGORIES_SORTED
 from .const import (
-    AREA_INFO,
+    AREA_NAMES,
     ATTRIBUTION,
     CONF_AREA,
     DOMAIN,
@@ -51,6 +55,63 @@ TOTAL_GENERATION_KEY = "total_generation"
 GENERATION_FORECAST_DEVICE_SUFFIX = "generation_forecast"
 WIND_SOLAR_DEVICE_SUFFIX = "wind_solar_forecast"
 WIND_SOLAR_EUROPE_DEVICE_SUFFIX = f"{TOTAL_EUROPE_CONTEXT}_{WIND_SOLAR_DEVICE_SUFFIX}"
+ENTITY_ID_PREFIX = f"{DOMAIN}."
+
+# Shared value accessors; ``methodcaller`` avoids a Python-level lambda frame
+# per description and is created once rather than per description.
+_CURRENT_VALUE = methodcaller("current_value")
+_NEXT_VALUE = methodcaller("next_value")
+_MIN_VALUE = methodcaller("min_value")
+_MAX_VALUE = methodcaller("max_value")
+_AVERAGE_VALUE = methodcaller("average_value")
+
+
+@lru_cache(maxsize=128)
+def _unique_id_prefix(entry_id: str, device_suffix: str) -> str:
+    return f"entsoe_data.{entry_id}.{device_suffix}."
+
+
+@lru_cache(maxsize=128)
+def _area_suffix(area_name: str) -> str:
+    return f" ({area_name})" if area_name else ""
+
+
+def _format_category_name(category: str) -> str:
+    return category.replace("_", " ")
+
+
+# Display names for every known category, computed once at import.
+# Categories outside ``PSR_CATEGORIES_SORTED`` fall back to formatting on demand.
+_CATEGORY_LABELS: dict[str, str] = {
+    category: _format_category_name(category).lower()
+    for category in (*PSR_CATEGORIES_SORTED, TOTAL_GENERATION_KEY)
+}
+_GENERATION_OUTPUT_NAMES: dict[str, str] = {
+    category: f"{label.title()} output" for category, label in _CATEGORY_LABELS.items()
+}
+_WIND_SOLAR_FORECAST_NAMES: dict[str, str] = {
+    category: f"{label.title()} forecast"
+    for category, label in _CATEGORY_LABELS.items()
+}
+
+
+def _category_label(category: str) -> str:
+    return _CATEGORY_LABELS.get(category) or _format_category_name(category).lower()
+
+
+def _generation_output_name(category: str) -> str:
+    return (
+        _GENERATION_OUTPUT_NAMES.get(category)
+        or f"{_format_category_name(category).title()} output"
+    )
+
+
+def _wind_solar_forecast_name(category: str) -> str:
+    return (
+        _WIND_SOLAR_FORECAST_NAMES.get(category)
+        or f"{_format_category_name(category).title()} forecast"
+    )
+
 
 @dataclass
 class EntsoeGenerationEntityDescription(SensorEntityDescription):
@@ -93,28 +154,38 @@ class EntsoeWindSolarEntityDescription(SensorEntityDescription):
     ] | None = None
     device_suffix: str = WIND_SOLAR_DEVICE_SUFFIX
 
+
+def _generation_categories(coordinator: EntsoeGenerationCoordinator) -> list[str]:
+    """Return the coordinator categories plus the total, in sorted order.
+
+    ``categories()`` is already sorted and de-duplicated, so the total key only
+    needs to be inserted in place when the coordinator did not report it.
+    """
+
+    categories = coordinator.categories()
+    if TOTAL_GENERATION_KEY not in categories:
+        insort(categories, TOTAL_GENERATION_KEY)
+    return categories
+
+
 def generation_sensor_descriptions(
     coordinator: EntsoeGenerationCoordinator,
 ) -> list[EntsoeGenerationEntityDescription]:
     """Create generation sensor descriptions for all categories."""
 
-    categories = set(coordinator.categories())
-    categories.add(TOTAL_GENERATION_KEY)
-
     descriptions: list[EntsoeGenerationEntityDescription] = []
-    for category in sorted(categories):
+    for category in _generation_categories(coordinator):
         key = f"generation_{category}"
-        name = "Total generation" if category == TOTAL_GENERATION_KEY else _format_category_name(category)
         descriptions.append(
             EntsoeGenerationEntityDescription(
                 key=key,
-                name=f"{name.title()} output",
+                name=_generation_output_name(category),
                 native_unit_of_measurement=GENERATION_UNIT,
                 state_class=SensorStateClass.MEASUREMENT,
                 icon="mdi:factory",
                 category=category,
-                value_fn=lambda coordinator, cat=category: coordinator.current_value(cat),
-                attrs_fn=lambda coordinator, cat=category: _generation_attrs(coordinator, cat),
+                value_fn=methodcaller("current_value", category),
+                attrs_fn=partial(_generation_attrs, category=category),
             )
         )
     return descriptions
@@ -125,16 +196,8 @@ def generation_total_europe_descriptions(
 ) -> list[EntsoeGenerationEntityDescription]:
     """Create generation sensor descriptions for Total Europe totals."""
 
-    categories = set(coordinator.categories())
-    categories.add(TOTAL_GENERATION_KEY)
-
     descriptions: list[EntsoeGenerationEntityDescription] = []
-    for category in sorted(categories):
-        name = (
-            "Total generation"
-            if category == TOTAL_GENERATION_KEY
-            else _format_category_name(category)
-        )
+    for category in _generation_categories(coordinator):
         key = (
             f"{TOTAL_EUROPE_CONTEXT}_generation_total"
             if category == TOTAL_GENERATION_KEY
@@ -143,15 +206,13 @@ def generation_total_europe_descriptions(
         descriptions.append(
             EntsoeGenerationEntityDescription(
                 key=key,
-                name=f"{name.title()} output",
+                name=_generation_output_name(category),
                 native_unit_of_measurement=GENERATION_UNIT,
                 state_class=SensorStateClass.MEASUREMENT,
                 icon="mdi:factory",
                 category=category,
-                value_fn=lambda coordinator, cat=category: coordinator.current_value(cat),
-                attrs_fn=lambda coordinator, cat=category: _generation_attrs(
-                    coordinator, cat
-                ),
+                value_fn=methodcaller("current_value", category),
+                attrs_fn=partial(_generation_attrs, category=category),
                 device_suffix=GENERATION_EUROPE_DEVICE_SUFFIX,
             )
         )
@@ -159,6 +220,25 @@ def generation_total_europe_descriptions(
     return descriptions
 
 
+def _memoized_attrs(
+    builder: Callable[..., dict[str, Any]],
+) -> Callable[..., dict[str, Any]]:
+    """Serve ``builder`` from the coordinator's attribute cache.
+
+    Every sensor of a category is refreshed on each coordinator push, but the
+    attributes only change with the data or the selected hour.
+    """
+
+    @wraps(builder)
+    def wrapper(coordinator: Any, **kwargs: Any) -> dict[str, Any]:
+        return coordinator.cached_attributes(
+            (builder, *kwargs.items()), partial(builder, coordinator, **kwargs)
+        )
+
+    return wrapper
+
+
+@_memoized_attrs
 def _generation_attrs(
     coordinator: EntsoeGenerationCoordinator, category: str
 ) -> dict[str, Any]:
@@ -193,17 +273,12 @@ def generation_per_area_descriptions(
     if not area_keys:
         return descriptions
     
-    categories = set(coordinator.categories())
-    categories.add(TOTAL_GENERATION_KEY)
+    categories = _generation_categories(coordinator)
     
     for area_key in area_keys:
-        area_name = AREA_INFO.get(area_key, {}).get("name", area_key)
-        for category in sorted(categories):
-            cat_name = (
-                "Total generation"
-                if category == TOTAL_GENERATION_KEY
-                else _format_category_name(category)
-            )
+        area_name = AREA_NAMES.get(area_key, area_key)
+        for category in categories:
+            cat_name = _category_label(category)
             key = (
                 f"{TOTAL_EUROPE_CONTEXT}_{area_key.lower()}_generation_total"
                 if category == TOTAL_GENERATION_KEY
@@ -212,13 +287,15 @@ def generation_per_area_descriptions(
             descriptions.append(
                 EntsoeGenerationEntityDescription(
                     key=key,
-                    name=f"{area_name} {cat_name.lower()} output",
+                    name=f"{area_name} {cat_name} output",
                     native_unit_of_measurement=GENERATION_UNIT,
                     state_class=SensorStateClass.MEASUREMENT,
                     icon="mdi:factory",
                     category=category,
-                    value_fn=lambda coord, ak=area_key, cat=category: coord.get_area_current_value(ak, cat),
-                    attrs_fn=lambda coord, ak=area_key, cat=category: _generation_per_area_attrs(coord, ak, cat),
+                    value_fn=methodcaller("get_area_current_value", area_key, category),
+                    attrs_fn=partial(
+                        _generation_per_area_attrs, area_key=area_key, category=category
+                    ),
                     device_suffix=f"{GENERATION_EUROPE_DEVICE_SUFFIX}_per_area",
                 )
             )
@@ -226,6 +303,7 @@ def generation_per_area_descriptions(
     return descriptions
 
 
+@_memoized_attrs
 def _generation_per_area_attrs(
     coordinator: EntsoeGenerationCoordinator, area_key: str, category: str
 ) -> dict[str, Any]:
@@ -233,11 +311,39 @@ def _generation_per_area_attrs(
     attrs: dict[str, Any] = {
         "timeline": coordinator.get_area_timeline(area_key, category),
         "area": area_key,
-        "area_name": AREA_INFO.get(area_key, {}).get("name", area_key),
+        "area_name": AREA_NAMES.get(area_key, area_key),
     }
     return attrs
 
 
+@_memoized_attrs
+def _load_attrs(
+    coordinator: EntsoeLoadCoordinator, include_next: bool
+) -> dict[str, Any]:
+    attrs: dict[str, Any] = {"timeline": coordinator.timeline()}
+    current_ts = coordinator.current_timestamp()
+    next_ts = coordinator.next_timestamp()
+    if include_next:
+        next_value = coordinator.next_value()
+        if next_value is not None:
+            attrs["next_value"] = next_value
+    if current_ts:
+        attrs["current_timestamp"] = current_ts.isoformat()
+    if next_ts:
+        attrs["next_timestamp"] = next_ts.isoformat()
+    # Add per-area timelines for Total Europe sensors
+    if coordinator.area_key == TOTAL_EUROPE_AREA:
+        area_timelines = coordinator.get_all_area_timelines()
+        if area_timelines:
+            attrs["area_timelines"] = area_timelines
+    return attrs
+
+
+@_memoized_attrs
+def _timeline_attrs(coordinator: Any) -> dict[str, Any]:
+    return {"timeline": coordinator.timeline()}
+
+
 _LOAD_SENSOR_TEMPLATES: tuple[
     tuple[
         str,
@@ -252,44 +358,49 @@ _LOAD_SENSOR_TEMPLATES: tuple[
         "current",
         "Current load forecast",
         "mdi:transmission-tower",
-        lambda coordinator: coordinator.current_value(),
-        lambda coordinator: _load_attrs(coordinator, include_next=True),
+        _CURRENT_VALUE,
+        partial(_load_attrs, include_next=True),
     ),
     (
         "next",
         "Next hour load forecast",
         "mdi:transmission-tower-export",
-        lambda coordinator: coordinator.next_value(),
-        lambda coordinator: _load_attrs(coordinator, include_next=False),
+        _NEXT_VALUE,
+        partial(_load_attrs, include_next=False),
     ),
     (
         "min",
         "Minimum load forecast",
         "mdi:arrow-collapse-down",
-        lambda coordinator: coordinator.min_value(),
-        lambda coordinator: {"timeline": coordinator.timeline()},
+        _MIN_VALUE,
+        _timeline_attrs,
     ),
     (
         "max",
         "Maximum load forecast",
         "mdi:arrow-expand-up",
-        lambda coordinator: coordinator.max_value(),
-        lambda coordinator: {"timeline": coordinator.timeline()},
+        _MAX_VALUE,
+        _timeline_attrs,
     ),
     (
         "avg",
         "Average load forecast",
         "mdi:chart-bell-curve",
-        lambda coordinator: coordinator.average_value(),
-        lambda coordinator: _load_attrs(coordinator, include_next=True),
+        _AVERAGE_VALUE,
+        partial(_load_attrs, include_next=True),
     ),
 )
 
 
+@cache
 def load_sensor_descriptions(
     horizon: str = LOAD_FORECAST_HORIZON_DAY_AHEAD,
 ) -> tuple[EntsoeLoadEntityDescription, ...]:
-    """Construct load forecast sensor descriptions for a given horizon."""
+    """Construct load forecast sensor descriptions for a given horizon.
+
+    The result only depends on ``horizon`` and is cached, so every config
+    entry shares the same immutable tuple of descriptions.
+    """
 
     config = LOAD_FORECAST_HORIZON_MAP[horizon]
     descriptions: list[EntsoeLoadEntityDescription] = []
@@ -317,6 +428,7 @@ def load_sensor_descriptions(
     return tuple(descriptions)
 
 
+@cache
 def load_total_europe_descriptions(
     horizon: str = LOAD_FORECAST_HORIZON_DAY_AHEAD,
 ) -> tuple[EntsoeLoadEntityDescription, ...]:
@@ -333,6 +445,7 @@ def load_total_europe_descriptions(
     )
 
 
+@cache
 def generation_forecast_sensor_descriptions() -> tuple[
     EntsoeGenerationForecastEntityDescription, ...
 ]:
@@ -345,10 +458,8 @@ def generation_forecast_sensor_descriptions() -> tuple[
             native_unit_of_measurement=GENERATION_UNIT,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:factory",
-            value_fn=lambda coordinator: coordinator.current_value(),
-            attrs_fn=lambda coordinator: _generation_forecast_attrs(
-                coordinator, include_next=True
-            ),
+            value_fn=_CURRENT_VALUE,
+            attrs_fn=partial(_generation_forecast_attrs, include_next=True),
         ),
         EntsoeGenerationForecastEntityDescription(
             key="generation_forecast_next",
@@ -356,10 +467,8 @@ def generation_forecast_sensor_descriptions() -> tuple[
             native_unit_of_measurement=GENERATION_UNIT,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:factory",
-            value_fn=lambda coordinator: coordinator.next_value(),
-            attrs_fn=lambda coordinator: _generation_forecast_attrs(
-                coordinator, include_next=False
-            ),
+            value_fn=_NEXT_VALUE,
+            attrs_fn=partial(_generation_forecast_attrs, include_next=False),
         ),
         EntsoeGenerationForecastEntityDescription(
             key="generation_forecast_min",
@@ -367,8 +476,8 @@ def generation_forecast_sensor_descriptions() -> tuple[
             native_unit_of_measurement=GENERATION_UNIT,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:arrow-collapse-down",
-            value_fn=lambda coordinator: coordinator.min_value(),
-            attrs_fn=lambda coordinator: {"timeline": coordinator.timeline()},
+            value_fn=_MIN_VALUE,
+            attrs_fn=_timeline_attrs,
         ),
         EntsoeGenerationForecastEntityDescription(
             key="generation_forecast_max",
@@ -376,8 +485,8 @@ def generation_forecast_sensor_descriptions() -> tuple[
             native_unit_of_measurement=GENERATION_UNIT,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:arrow-expand-up",
-            value_fn=lambda coordinator: coordinator.max_value(),
-            attrs_fn=lambda coordinator: {"timeline": coordinator.timeline()},
+            value_fn=_MAX_VALUE,
+            attrs_fn=_timeline_attrs,
         ),
         EntsoeGenerationForecastEntityDescription(
             key="generation_forecast_avg",
@@ -385,10 +494,8 @@ def generation_forecast_sensor_descriptions() -> tuple[
             native_unit_of_measurement=GENERATION_UNIT,
             state_class=SensorStateClass.MEASUREMENT,
             icon="mdi:chart-bell-curve",
-            value_fn=lambda coordinator: coordinator.average_value(),
-            attrs_fn=lambda coordinator: _generation_forecast_attrs(
-                coordinator, include_next=True
-            ),
+            value_fn=_AVERAGE_VALUE,
+            attrs_fn=partial(_generation_forecast_attrs, include_next=True),
         ),
     )
 
@@ -398,12 +505,10 @@ def wind_solar_sensor_descriptions(
 ) -> list[EntsoeWindSolarEntityDescription]:
     """Construct wind and solar forecast sensor descriptions."""
 
-    categories = set(coordinator.categories())
-
     descriptions: list[EntsoeWindSolarEntityDescription] = []
-    for category in sorted(categories):
+    for category in coordinator.categories():
         key = f"wind_solar_{category}"
-        name = f"{_format_category_name(category).title()} forecast"
+        name = _wind_solar_forecast_name(category)
         descriptions.append(
             EntsoeWindSolarEntityDescription(
                 key=key,
@@ -414,10 +519,8 @@ def wind_solar_sensor_descriptions(
                 if "wind" in category
                 else "mdi:weather-sunny",
                 category=category,
-                value_fn=lambda coordinator, cat=category: coordinator.current_value(cat),
-                attrs_fn=lambda coordinator, cat=category: _wind_solar_attrs(
-                    coordinator, cat
-                ),
+                value_fn=methodcaller("current_value", category),
+                attrs_fn=partial(_wind_solar_attrs, category=category),
             )
         )
     return descriptions
@@ -444,28 +547,6 @@ def wind_solar_total_europe_descriptions(
     ]
 
 
-def _load_attrs(
-    coordinator: EntsoeLoadCoordinator, include_next: bool
-) -> dict[str, Any]:
-    attrs: dict[str, Any] = {"timeline": coordinator.timeline()}
-    current_ts = coordinator.current_timestamp()
-    next_ts = coordinator.next_timestamp()
-    if include_next:
-        next_value = coordinator.next_value()
-        if next_value is not None:
-            attrs["next_value"] = next_value
-    if current_ts:
-        attrs["current_timestamp"] = current_ts.isoformat()
-    if next_ts:
-        attrs["next_timestamp"] = next_ts.isoformat()
-    # Add per-area timelines for Total Europe sensors
-    if coordinator.area_key == TOTAL_EUROPE_AREA:
-        area_timelines = coordinator.get_all_area_timelines()
-        if area_timelines:
-            attrs["area_timelines"] = area_timelines
-    return attrs
-
-
 def load_per_area_descriptions(
     coordinator: EntsoeLoadCoordinator,
     horizon: str = LOAD_FORECAST_HORIZON_DAY_AHEAD,
@@ -481,7 +562,7 @@ def load_per_area_descriptions(
     config = LOAD_FORECAST_HORIZON_MAP[horizon]
     
     for area_key in area_keys:
-        area_name = AREA_INFO.get(area_key, {}).get("name", area_key)
+        area_name = AREA_NAMES.get(area_key, area_key)
         
         # Create current load sensor for this area
         key = f"{TOTAL_EUROPE_CONTEXT}_{area_key.lower()}_{config.sensor_key_prefix}_current"
@@ -496,8 +577,8 @@ def load_per_area_descriptions(
                 native_unit_of_measurement=LOAD_UNIT,
                 state_class=SensorStateClass.MEASUREMENT,
                 icon="mdi:transmission-tower",
-                value_fn=lambda coord, ak=area_key: coord.get_area_current_value(ak),
-                attrs_fn=lambda coord, ak=area_key: _load_per_area_attrs(coord, ak),
+                value_fn=methodcaller("get_area_current_value", area_key),
+                attrs_fn=partial(_load_per_area_attrs, area_key=area_key),
                 device_suffix=f"{config.europe_device_suffix}_per_area",
             )
         )
@@ -505,6 +586,7 @@ def load_per_area_descriptions(
     return descriptions
 
 
+@_memoized_attrs
 def _load_per_area_attrs(
     coordinator: EntsoeLoadCoordinator, area_key: str
 ) -> dict[str, Any]:
@@ -512,11 +594,12 @@ def _load_per_area_attrs(
     attrs: dict[str, Any] = {
         "timeline": coordinator.get_area_timeline(area_key),
         "area": area_key,
-        "area_name": AREA_INFO.get(area_key, {}).get("name", area_key),
+        "area_name": AREA_NAMES.get(area_key, area_key),
     }
     return attrs
 
 
+@_memoized_attrs
 def _generation_forecast_attrs(
     coordinator: EntsoeGenerationForecastCoordinator, include_next: bool
 ) -> dict[str, Any]:
@@ -534,6 +617,7 @@ def _generation_forecast_attrs(
     return attrs
 
 
+@_memoized_attrs
 def _wind_solar_attrs(
     coordinator: EntsoeWindSolarForecastCoordinator, category: str
 ) -> dict[str, Any]:
@@ -566,23 +650,25 @@ def wind_solar_per_area_descriptions(
     if not area_keys:
         return descriptions
     
-    categories = set(coordinator.categories())
+    categories = coordinator.categories()
     
     for area_key in area_keys:
-        area_name = AREA_INFO.get(area_key, {}).get("name", area_key)
-        for category in sorted(categories):
-            cat_name = _format_category_name(category)
+        area_name = AREA_NAMES.get(area_key, area_key)
+        for category in categories:
+            cat_name = _category_label(category)
             key = f"{TOTAL_EUROPE_CONTEXT}_{area_key.lower()}_wind_solar_{category}"
             descriptions.append(
                 EntsoeWindSolarEntityDescription(
                     key=key,
-                    name=f"{area_name} {cat_name.lower()} forecast",
+                    name=f"{area_name} {cat_name} forecast",
                     native_unit_of_measurement=GENERATION_UNIT,
                     state_class=SensorStateClass.MEASUREMENT,
                     icon="mdi:weather-windy" if "wind" in category else "mdi:solar-power",
                     category=category,
-                    value_fn=lambda coord, ak=area_key, cat=category: coord.get_area_current_value(ak, cat),
-                    attrs_fn=lambda coord, ak=area_key, cat=category: _wind_solar_per_area_attrs(coord, ak, cat),
+                    value_fn=methodcaller("get_area_current_value", area_key, category),
+                    attrs_fn=partial(
+                        _wind_solar_per_area_attrs, area_key=area_key, category=category
+                    ),
                     device_suffix=f"{WIND_SOLAR_EUROPE_DEVICE_SUFFIX}_per_area",
                 )
             )
@@ -590,6 +676,7 @@ def wind_solar_per_area_descriptions(
     return descriptions
 
 
+@_memoized_attrs
 def _wind_solar_per_area_attrs(
     coordinator: EntsoeWindSolarForecastCoordinator, area_key: str, category: str
 ) -> dict[str, Any]:
@@ -597,7 +684,7 @@ def _wind_solar_per_area_attrs(
     attrs: dict[str, Any] = {
         "timeline": coordinator.get_area_timeline(area_key, category),
         "area": area_key,
-        "area_name": AREA_INFO.get(area_key, {}).get("name", area_key),
+        "area_name": AREA_NAMES.get(area_key, area_key),
     }
     return attrs
 
@@ -626,7 +713,7 @@ async def async_setup_entry(
             _create_generation_sensors(
                 config_entry,
                 generation_europe_coordinator,
-                area_name=AREA_INFO.get(TOTAL_EUROPE_AREA, {}).get("name", ""),
+                area_name=AREA_NAMES.get(TOTAL_EUROPE_AREA, ""),
                 descriptions=generation_total_europe_descriptions(
                     generation_europe_coordinator
                 ),
@@ -637,14 +724,14 @@ async def async_setup_entry(
             _create_generation_sensors(
                 config_entry,
                 generation_europe_coordinator,
-                area_name=AREA_INFO.get(TOTAL_EUROPE_AREA, {}).get("name", ""),
+                area_name=AREA_NAMES.get(TOTAL_EUROPE_AREA, ""),
                 descriptions=generation_per_area_descriptions(
                     generation_europe_coordinator
                 ),
             )
         )
 
-    europe_area_name = AREA_INFO.get(TOTAL_EUROPE_AREA, {}).get("name", "")
+    europe_area_name = AREA_NAMES.get(TOTAL_EUROPE_AREA, "")
 
     for horizon in LOAD_FORECAST_HORIZONS:
         if load_coordinator := coordinators.get(horizon.coordinator_key):
@@ -701,7 +788,7 @@ async def async_setup_entry(
             _create_wind_solar_sensors(
                 config_entry,
                 wind_solar_forecast_europe_coordinator,
-                area_name=AREA_INFO.get(TOTAL_EUROPE_AREA, {}).get("name", ""),
+                area_name=AREA_NAMES.get(TOTAL_EUROPE_AREA, ""),
                 descriptions=wind_solar_total_europe_descriptions(
                     wind_solar_forecast_europe_coordinator
                 ),
@@ -712,7 +799,7 @@ async def async_setup_entry(
             _create_wind_solar_sensors(
                 config_entry,
                 wind_solar_forecast_europe_coordinator,
-                area_name=AREA_INFO.get(TOTAL_EUROPE_AREA, {}).get("name", ""),
+                area_name=AREA_NAMES.get(TOTAL_EUROPE_AREA, ""),
                 descriptions=wind_solar_per_area_descriptions(
                     wind_solar_forecast_europe_coordinator
                 ),
@@ -721,6 +808,47 @@ async def async_setup_entry(
 
     if entities:
         async_add_entities(entities, True)
+
+
+def _resolve_area_name(options: Mapping[str, Any], area_name: str | None) -> str:
+    """Return ``area_name`` or the display name of the configured area."""
+
+    if area_name is not None:
+        return area_name
+    area_key = options.get(CONF_AREA)
+    return AREA_NAMES.get(area_key, area_key or "")
+
+
+def _instantiate_sensors(
+    sensor_cls: type[_HourlyCoordinatorSensor],
+    coordinator: Any,
+    descriptions: Iterable[Any],
+    config_entry: ConfigEntry,
+    area_name: str,
+) -> list[RestoreSensor]:
+    """Create sensors, sharing one ``DeviceInfo`` per device suffix."""
+
+    devices: dict[str, DeviceInfo] = {}
+    sensors: list[RestoreSensor] = []
+    for description in descriptions:
+        device_suffix = description.device_suffix or sensor_cls._default_device_suffix
+        device_info = devices.get(device_suffix)
+        if device_info is None:
+            device_info = devices[device_suffix] = sensor_cls._build_device_info(
+                config_entry.entry_id, device_suffix, area_name
+            )
+        sensors.append(
+            sensor_cls(
+                coordinator,
+                description,
+                config_entry,
+                area_name,
+                device_info=device_info,
+            )
+        )
+    return sensors
+
+
 def _create_generation_sensors(
     config_entry: ConfigEntry,
     coordinator: EntsoeGenerationCoordinator,
@@ -730,24 +858,17 @@ def _create_generation_sensors(
 ) -> list[RestoreSensor]:
     if not coordinator.data and getattr(coordinator, "last_successful_update", None) is None:
         return []
-    area_key = config_entry.options.get(CONF_AREA)
-    resolved_area_name = (
-        area_name
-        if area_name is not None
-        else AREA_INFO.get(area_key, {}).get("name", area_key or "")
-    )
+    resolved_area_name = _resolve_area_name(config_entry.options, area_name)
 
     selected_descriptions = descriptions or generation_sensor_descriptions(coordinator)
 
-    return [
-        EntsoeGenerationSensor(
-            coordinator,
-            description,
-            config_entry,
-            resolved_area_name,
-        )
-        for description in selected_descriptions
-    ]
+    return _instantiate_sensors(
+        EntsoeGenerationSensor,
+        coordinator,
+        selected_descriptions,
+        config_entry,
+        resolved_area_name,
+    )
 
 
 def _create_load_sensors(
@@ -759,24 +880,17 @@ def _create_load_sensors(
 ) -> list[RestoreSensor]:
     if not coordinator.data and getattr(coordinator, "last_successful_update", None) is None:
         return []
-    area_key = config_entry.options.get(CONF_AREA)
-    resolved_area_name = (
-        area_name
-        if area_name is not None
-        else AREA_INFO.get(area_key, {}).get("name", area_key or "")
-    )
+    resolved_area_name = _resolve_area_name(config_entry.options, area_name)
 
     selected_descriptions = descriptions or load_sensor_descriptions()
 
-    return [
-        EntsoeLoadSensor(
-            coordinator,
-            description,
-            config_entry,
-            resolved_area_name,
-        )
-        for description in selected_descriptions
-    ]
+    return _instantiate_sensors(
+        EntsoeLoadSensor,
+        coordinator,
+        selected_descriptions,
+        config_entry,
+        resolved_area_name,
+    )
 
 
 def _create_generation_forecast_sensors(
@@ -790,24 +904,17 @@ def _create_generation_forecast_sensors(
 ) -> list[RestoreSensor]:
     if not coordinator.data and getattr(coordinator, "last_successful_update", None) is None:
         return []
-    area_key = config_entry.options.get(CONF_AREA)
-    resolved_area_name = (
-        area_name
-        if area_name is not None
-        else AREA_INFO.get(area_key, {}).get("name", area_key or "")
-    )
+    resolved_area_name = _resolve_area_name(config_entry.options, area_name)
 
     selected_descriptions = descriptions or generation_forecast_sensor_descriptions()
 
-    return [
-        EntsoeGenerationForecastSensor(
-            coordinator,
-            description,
-            config_entry,
-            resolved_area_name,
-        )
-        for description in selected_descriptions
-    ]
+    return _instantiate_sensors(
+        EntsoeGenerationForecastSensor,
+        coordinator,
+        selected_descriptions,
+        config_entry,
+        resolved_area_name,
+    )
 
 
 def _create_wind_solar_sensors(
@@ -819,24 +926,17 @@ def _create_wind_solar_sensors(
 ) -> list[RestoreSensor]:
     if not coordinator.data and getattr(coordinator, "last_successful_update", None) is None:
         return []
-    area_key = config_entry.options.get(CONF_AREA)
-    resolved_area_name = (
-        area_name
-        if area_name is not None
-        else AREA_INFO.get(area_key, {}).get("name", area_key or "")
-    )
+    resolved_area_name = _resolve_area_name(config_entry.options, area_name)
 
     selected_descriptions = descriptions or wind_solar_sensor_descriptions(coordinator)
 
-    return [
-        EntsoeWindSolarForecastSensor(
-            coordinator,
-            description,
-            config_entry,
-            resolved_area_name,
-        )
-        for description in selected_descriptions
-    ]
+    return _instantiate_sensors(
+        EntsoeWindSolarForecastSensor,
+        coordinator,
+        selected_descriptions,
+        config_entry,
+        resolved_area_name,
+    )
 
 
 class _HourlyCoordinatorSensor(CoordinatorEntity, RestoreSensor):
@@ -844,9 +944,11 @@ class _HourlyCoordinatorSensor(CoordinatorEntity, RestoreSensor):
 
     _attr_attribution = ATTRIBUTION
 
+    _default_device_suffix: str
+    _device_name: str
+
     def __init__(self, coordinator):
         super().__init__(coordinator)
-        self._update_job = HassJob(self.async_schedule_update_ha_state)
         self._unsub_update: Callable[[], None] | None = None
         self._last_update_success = True
 
@@ -868,25 +970,41 @@ class _HourlyCoordinatorSensor(CoordinatorEntity, RestoreSensor):
             self._unsub_update = None
         await super().async_will_remove_from_hass()
 
+    @classmethod
+    def _build_device_info(
+        cls, entry_id: str, device_suffix: str, area_name: str
+    ) -> DeviceInfo:
+        return DeviceInfo(
+            entry_type=DeviceEntryType.SERVICE,
+            identifiers={(DOMAIN, f"{entry_id}_{device_suffix}")},
+            manufacturer="entso-e",
+            name=cls._device_name + _area_suffix(area_name),
+        )
+
     async def async_update(self) -> None:
-        if self._unsub_update:
-            self._unsub_update()
-            self._unsub_update = None
+        self._reschedule_hourly()
+        self._refresh_from_coordinator()
+
+    def _reschedule_hourly(self) -> None:
+        # The coordinator owns a single hourly timer shared by all of its
+        # sensors; subscribe once and stay registered until removal.
+        if self._unsub_update is None:
+            self._unsub_update = self.coordinator.async_add_hourly_listener(
+                self._handle_hourly_tick
+            )
 
-        self._unsub_update = event.async_track_point_in_utc_time(
-            self.hass,
-            self._update_job,
-            utcnow().replace(minute=0, second=0, microsecond=0) + timedelta(hours=1),
-        )
+    def _handle_hourly_tick(self) -> None:
+        self.async_schedule_update_ha_state(True)
 
+    def _refresh_from_coordinator(self) -> None:
         try:
-            await self._async_handle_coordinator_update()
+            self._update_from_coordinator()
             self._last_update_success = True
         except Exception as exc:  # pragma: no cover - defensive safeguard
             self._last_update_success = False
             _LOGGER.warning("Unable to update entity '%s': %s", self.entity_id, exc)
 
-    async def _async_handle_coordinator_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         raise NotImplementedError
 
     @property
@@ -908,14 +1026,19 @@ class _HourlyCoordinatorSensor(CoordinatorEntity, RestoreSensor):
         return True
 
     def _handle_coordinator_update(self) -> None:
+        # Refresh the values inline before the base class writes the state,
+        # instead of scheduling a separate async_update task per push.
+        self._reschedule_hourly()
+        self._refresh_from_coordinator()
         super()._handle_coordinator_update()
-        if self.hass.is_running:
-            self.hass.async_create_task(self.async_update())
 
 
 class EntsoeGenerationSensor(_HourlyCoordinatorSensor):
     """Representation of a generation sensor."""
 
+    _default_device_suffix = GENERATION_DEVICE_SUFFIX
+    _device_name = "ENTSO-e Generation"
+
     entity_description: EntsoeGenerationEntityDescription
 
     def __init__(
@@ -924,27 +1047,24 @@ class EntsoeGenerationSensor(_HourlyCoordinatorSensor):
         description: EntsoeGenerationEntityDescription,
         config_entry: ConfigEntry,
         area_name: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        device_suffix = description.device_suffix or GENERATION_DEVICE_SUFFIX
+        device_suffix = description.device_suffix or self._default_device_suffix
+        area_suffix = _area_suffix(area_name)
         self._attr_unique_id = (
-            f"entsoe_data.{config_entry.entry_id}.{device_suffix}.{description.key}"
-        )
-        self._attr_name = (
-            f"{description.name} ({area_name})" if area_name else description.name
+            _unique_id_prefix(config_entry.entry_id, device_suffix) + description.key
         )
+        self._attr_name = description.name + area_suffix
         self._attr_icon = description.icon
-        self.entity_id = f"{DOMAIN}.{description.key}"
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, f"{config_entry.entry_id}_{device_suffix}")},
-            manufacturer="entso-e",
-            name="ENTSO-e Generation"
-            + ((f" ({area_name})") if area_name else ""),
+        self.entity_id = ENTITY_ID_PREFIX + description.key
+        self._attr_device_info = device_info or self._build_device_info(
+            config_entry.entry_id, device_suffix, area_name
         )
 
-    async def _async_handle_coordinator_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         if not self.coordinator.data:
             # No fresh data available
             # If we had successful updates before, keep showing the last known value
@@ -973,6 +1093,9 @@ class EntsoeGenerationSensor(_HourlyCoordinatorSensor):
 class EntsoeLoadSensor(_HourlyCoordinatorSensor):
     """Representation of a total load forecast sensor."""
 
+    _default_device_suffix = LOAD_DEVICE_SUFFIX
+    _device_name = "ENTSO-e Load forecast"
+
     entity_description: EntsoeLoadEntityDescription
 
     def __init__(
@@ -981,27 +1104,24 @@ class EntsoeLoadSensor(_HourlyCoordinatorSensor):
         description: EntsoeLoadEntityDescription,
         config_entry: ConfigEntry,
         area_name: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        device_suffix = description.device_suffix or LOAD_DEVICE_SUFFIX
+        device_suffix = description.device_suffix or self._default_device_suffix
+        area_suffix = _area_suffix(area_name)
         self._attr_unique_id = (
-            f"entsoe_data.{config_entry.entry_id}.{device_suffix}.{description.key}"
-        )
-        self._attr_name = (
-            f"{description.name} ({area_name})" if area_name else description.name
+            _unique_id_prefix(config_entry.entry_id, device_suffix) + description.key
         )
+        self._attr_name = description.name + area_suffix
         self._attr_icon = description.icon
-        self.entity_id = f"{DOMAIN}.{description.key}"
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, f"{config_entry.entry_id}_{device_suffix}")},
-            manufacturer="entso-e",
-            name="ENTSO-e Load forecast"
-            + ((f" ({area_name})") if area_name else ""),
+        self.entity_id = ENTITY_ID_PREFIX + description.key
+        self._attr_device_info = device_info or self._build_device_info(
+            config_entry.entry_id, device_suffix, area_name
         )
 
-    async def _async_handle_coordinator_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         if not self.coordinator.data:
             # No fresh data available
             # If we had successful updates before, keep showing the last known value
@@ -1030,6 +1150,9 @@ class EntsoeLoadSensor(_HourlyCoordinatorSensor):
 class EntsoeGenerationForecastSensor(_HourlyCoordinatorSensor):
     """Representation of a generation forecast sensor."""
 
+    _default_device_suffix = GENERATION_FORECAST_DEVICE_SUFFIX
+    _device_name = "ENTSO-e Generation forecast"
+
     entity_description: EntsoeGenerationForecastEntityDescription
 
     def __init__(
@@ -1038,27 +1161,24 @@ class EntsoeGenerationForecastSensor(_HourlyCoordinatorSensor):
         description: EntsoeGenerationForecastEntityDescription,
         config_entry: ConfigEntry,
         area_name: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        device_suffix = description.device_suffix or GENERATION_FORECAST_DEVICE_SUFFIX
+        device_suffix = description.device_suffix or self._default_device_suffix
+        area_suffix = _area_suffix(area_name)
         self._attr_unique_id = (
-            f"entsoe_data.{config_entry.entry_id}.{device_suffix}.{description.key}"
-        )
-        self._attr_name = (
-            f"{description.name} ({area_name})" if area_name else description.name
+            _unique_id_prefix(config_entry.entry_id, device_suffix) + description.key
         )
+        self._attr_name = description.name + area_suffix
         self._attr_icon = description.icon
-        self.entity_id = f"{DOMAIN}.{description.key}"
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, f"{config_entry.entry_id}_{device_suffix}")},
-            manufacturer="entso-e",
-            name="ENTSO-e Generation forecast"
-            + ((f" ({area_name})") if area_name else ""),
+        self.entity_id = ENTITY_ID_PREFIX + description.key
+        self._attr_device_info = device_info or self._build_device_info(
+            config_entry.entry_id, device_suffix, area_name
         )
 
-    async def _async_handle_coordinator_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         if not self.coordinator.data:
             # No fresh data available
             # If we had successful updates before, keep showing the last known value
@@ -1087,6 +1207,9 @@ class EntsoeGenerationForecastSensor(_HourlyCoordinatorSensor):
 class EntsoeWindSolarForecastSensor(_HourlyCoordinatorSensor):
     """Representation of a wind and solar forecast sensor."""
 
+    _default_device_suffix = WIND_SOLAR_DEVICE_SUFFIX
+    _device_name = "ENTSO-e Wind and solar forecast"
+
     entity_description: EntsoeWindSolarEntityDescription
 
     def __init__(
@@ -1095,27 +1218,24 @@ class EntsoeWindSolarForecastSensor(_HourlyCoordinatorSensor):
         description: EntsoeWindSolarEntityDescription,
         config_entry: ConfigEntry,
         area_name: str,
+        *,
+        device_info: DeviceInfo | None = None,
     ) -> None:
         super().__init__(coordinator)
         self.entity_description = description
-        device_suffix = description.device_suffix or WIND_SOLAR_DEVICE_SUFFIX
+        device_suffix = description.device_suffix or self._default_device_suffix
+        area_suffix = _area_suffix(area_name)
         self._attr_unique_id = (
-            f"entsoe_data.{config_entry.entry_id}.{device_suffix}.{description.key}"
-        )
-        self._attr_name = (
-            f"{description.name} ({area_name})" if area_name else description.name
+            _unique_id_prefix(config_entry.entry_id, device_suffix) + description.key
         )
+        self._attr_name = description.name + area_suffix
         self._attr_icon = description.icon
-        self.entity_id = f"{DOMAIN}.{description.key}"
-        self._attr_device_info = DeviceInfo(
-            entry_type=DeviceEntryType.SERVICE,
-            identifiers={(DOMAIN, f"{config_entry.entry_id}_{device_suffix}")},
-            manufacturer="entso-e",
-            name="ENTSO-e Wind and solar forecast"
-            + ((f" ({area_name})") if area_name else ""),
+        self.entity_id = ENTITY_ID_PREFIX + description.key
+        self._attr_device_info = device_info or self._build_device_info(
+            config_entry.entry_id, device_suffix, area_name
         )
 
-    async def _async_handle_coordinator_update(self) -> None:
+    def _update_from_coordinator(self) -> None:
         if not self.coordinator.data:
             # No fresh data available
             # If we had successful updates before, keep showing the last known value
@@ -1140,6 +1260,3 @@ class EntsoeWindSolarForecastSensor(_HourlyCoordinatorSensor):
                 self.coordinator
             )
 
-
-def _format_category_name(category: str) -> str:
-    return category.replace("_", " ")
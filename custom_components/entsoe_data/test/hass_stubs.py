@@ -18,391 +18,586 @@ import sys
 
 T = TypeVar("T")
 
+_STUBS_INSTALLED = False
 
-def _ensure_module(name: str) -> ModuleType:
+
+def _ensure_module(name: str, is_package: bool = False) -> ModuleType:
     """Ensure that a module with ``name`` exists in :mod:`sys.modules`."""
 
     module = sys.modules.get(name)
     if module is None:
         module = ModuleType(name)
+        if is_package:
+            module.__path__ = []  # mark as package
         sys.modules[name] = module
     return module
 
 
-def install_hass_stubs() -> None:
-    """Install Home Assistant and Jinja2 stubs used during testing."""
+# ----------------------------------------------------------------------
+# Components > sensor
 
-    if "homeassistant" in sys.modules:
-        return
 
-    # Root package
-    ha = _ensure_module("homeassistant")
-    ha.__path__ = []  # mark as package
-
-    # ------------------------------------------------------------------
-    # Components > sensor
-    components = _ensure_module("homeassistant.components")
-    components.__path__ = []
-    sensor = _ensure_module("homeassistant.components.sensor")
-
-    class SensorDeviceClass:
-        TIMESTAMP = "timestamp"
-
-    class SensorStateClass:
-        MEASUREMENT = "measurement"
-
-    @dataclass
-    class SensorEntityDescription:
-        key: str
-        name: str
-        native_unit_of_measurement: str | None = None
-        state_class: str | None = None
-        icon: str | None = None
-        suggested_display_precision: int | None = None
-        device_class: str | None = None
-
-    @dataclass
-    class SensorData:
-        """Stub for SensorData returned by async_get_last_sensor_data."""
-        native_value: Any
-        native_unit_of_measurement: str | None = None
-
-    class RestoreSensor:
-        def __init__(self) -> None:
-            self._attr_native_value: Any = None
-            self._attr_extra_state_attributes: Dict[str, Any] = {}
-            self._attr_icon: str | None = None
-            self._attr_name: str | None = None
-            self._attr_unique_id: str | None = None
-            self._attr_device_info: Any = None
-            self._attr_suggested_display_precision: int | None = None
-            self.entity_id: str | None = None
-            self.hass: Any = None
-            self._last_sensor_data: SensorData | None = None
-
-        async def async_get_last_sensor_data(self) -> SensorData | None:
-            """Return the last stored sensor data (mock)."""
-            return self._last_sensor_data
-
-        async def async_added_to_hass(self) -> None:
-            """Handle entity added to hass (mock)."""
-            return None
-
-        async def async_update(self) -> None:  # pragma: no cover - stub
-            return None
-
-        def async_schedule_update_ha_state(self, force_refresh: bool = False):
-            return None
-
-        @property
-        def native_value(self):
-            return self._attr_native_value
-
-        @property
-        def extra_state_attributes(self):
-            return getattr(self, "_attr_extra_state_attributes", {})
-
-    sensor.SensorDeviceClass = SensorDeviceClass
-    sensor.SensorStateClass = SensorStateClass
-    sensor.SensorEntityDescription = SensorEntityDescription
-    sensor.RestoreSensor = RestoreSensor
-    sensor.SensorData = SensorData
-
-    # ------------------------------------------------------------------
-    # Config entries
-    config_entries = _ensure_module("homeassistant.config_entries")
-
-    class ConfigEntry:  # pragma: no cover - simple container
-        entry_id: str
-        data: dict[str, Any]
-        options: dict[str, Any]
-
-    config_entries.ConfigEntry = ConfigEntry
-    config_entries.SOURCE_RECONFIGURE = "reconfigure"
-
-    # ------------------------------------------------------------------
-    # Constants
-    const = _ensure_module("homeassistant.const")
-    const.PERCENTAGE = "%"
-    const.CURRENCY_EURO = "EUR"
-
-    class Platform(str, Enum):
-        SENSOR = "sensor"
-
-    const.Platform = Platform
-
-    exceptions_mod = _ensure_module("homeassistant.exceptions")
-
-    class ServiceValidationError(Exception):  # pragma: no cover - stub
-        def __init__(
-            self,
-            *args,
-            translation_domain: str | None = None,
-            translation_key: str | None = None,
-            translation_placeholders: Dict[str, Any] | None = None,
-            **kwargs,
-        ) -> None:
-            super().__init__(*args)
-            self.translation_domain = translation_domain
-            self.translation_key = translation_key
-            self.translation_placeholders = translation_placeholders or {}
-
-    exceptions_mod.ServiceValidationError = ServiceValidationError
-
-    config_entries.ConfigEntryState = Enum(  # type: ignore[attr-defined]
-        "ConfigEntryState",
-        {"LOADED": "loaded"},
-    )
-
-    # ------------------------------------------------------------------
-    # Core helpers
-    core = _ensure_module("homeassistant.core")
-
-    class HassJob:  # pragma: no cover - minimal wrapper
-        def __init__(self, action: Callable) -> None:
-            self.action = action
-
-    @dataclass
-    class ServiceCall:  # pragma: no cover - unused stub
-        data: dict[str, Any]
-
-    class ServiceResponse(dict):  # pragma: no cover - unused stub
-        pass
+class SensorDeviceClass:
+    TIMESTAMP = "timestamp"
 
-    class SupportsResponse(Enum):  # pragma: no cover - stub enum
-        ONLY = "only"
 
-    def callback(func: Callable) -> Callable:  # pragma: no cover - stub decorator
-        return func
+class SensorStateClass:
+    MEASUREMENT = "measurement"
 
-    class HomeAssistant:  # pragma: no cover - simple placeholder
-        def __init__(self) -> None:
-            self.data: dict[str, Any] = {}
-            self.loop = None
 
-        async def async_add_executor_job(self, func: Callable, *args, **kwargs):
-            return func(*args, **kwargs)
+@dataclass
+class SensorEntityDescription:
+    key: str
+    name: str
+    native_unit_of_measurement: str | None = None
+    state_class: str | None = None
+    icon: str | None = None
+    suggested_display_precision: int | None = None
+    device_class: str | None = None
 
-    core.HassJob = HassJob
-    core.ServiceCall = ServiceCall
-    core.ServiceResponse = ServiceResponse
-    core.SupportsResponse = SupportsResponse
-    core.callback = callback
-    core.HomeAssistant = HomeAssistant
 
-    # ------------------------------------------------------------------
-    # Helpers package
-    helpers = _ensure_module("homeassistant.helpers")
-    helpers.__path__ = []
+@dataclass
+class SensorData:
+    """Stub for SensorData returned by async_get_last_sensor_data."""
+    native_value: Any
+    native_unit_of_measurement: str | None = None
 
-    template_mod = _ensure_module("homeassistant.helpers.template")
 
-    class Template:
-        def __init__(self, template: str, hass: Any | None = None) -> None:
-            self.template = template
-            self.hass = hass
+class RestoreSensor:
+    def __init__(self) -> None:
+        self._attr_native_value: Any = None
+        self._attr_extra_state_attributes: Dict[str, Any] = {}
+        self._attr_icon: str | None = None
+        self._attr_name: str | None = None
+        self._attr_unique_id: str | None = None
+        self._attr_device_info: Any = None
+        self._attr_suggested_display_precision: int | None = None
+        self.entity_id: str | None = None
+        self.hass: Any = None
+        self._last_sensor_data: SensorData | None = None
 
-        def async_render(self, *args, **kwargs):  # pragma: no cover - stub
-            return kwargs.get("current_price", self.template)
+    async def async_get_last_sensor_data(self) -> SensorData | None:
+        """Return the last stored sensor data (mock)."""
+        return self._last_sensor_data
 
-    template_mod.Template = Template
+    async def async_added_to_hass(self) -> None:
+        """Handle entity added to hass (mock)."""
+        return None
 
-    config_validation = _ensure_module("homeassistant.helpers.config_validation")
+    async def async_update(self) -> None:  # pragma: no cover - stub
+        return None
 
-    def template(value):  # pragma: no cover - stub validator
-        if isinstance(value, Template):
-            return value
-        return Template(value)
+    def async_schedule_update_ha_state(self, force_refresh: bool = False):
+        return None
 
-    config_validation.template = template
+    @property
+    def native_value(self):
+        return self._attr_native_value
 
-    device_registry = _ensure_module("homeassistant.helpers.device_registry")
+    @property
+    def extra_state_attributes(self):
+        return getattr(self, "_attr_extra_state_attributes", {})
 
-    class DeviceEntryType:
-        SERVICE = "service"
 
-    class DeviceInfo:
-        def __init__(self, **kwargs) -> None:
-            self.__dict__.update(kwargs)
+# ----------------------------------------------------------------------
+# Config entries and constants
 
-    device_registry.DeviceEntryType = DeviceEntryType
-    device_registry.DeviceInfo = DeviceInfo
 
-    entity_platform = _ensure_module("homeassistant.helpers.entity_platform")
-    entity_platform.AddEntitiesCallback = Callable
+class ConfigEntry:  # pragma: no cover - simple container
+    entry_id: str
+    data: dict[str, Any]
+    options: dict[str, Any]
 
-    typing_mod = _ensure_module("homeassistant.helpers.typing")
-    typing_mod.StateType = Any
-    typing_mod.ConfigType = Dict[str, Any]
 
-    selector = _ensure_module("homeassistant.helpers.selector")
+ConfigEntryState = Enum("ConfigEntryState", {"LOADED": "loaded"})
 
-    class ConfigEntrySelector:  # pragma: no cover - stub selector
-        def __init__(self, config: Dict[str, Any] | None = None) -> None:
-            self.config = config or {}
 
-    selector.ConfigEntrySelector = ConfigEntrySelector
+class AbortFlow(Exception):
+    def __init__(self, reason: str) -> None:
+        super().__init__(reason)
+        self.reason = reason
 
-    event = _ensure_module("homeassistant.helpers.event")
 
-    async def async_track_point_in_utc_time(  # pragma: no cover - stub
-        hass, job: Callable[..., Awaitable], when
-    ):
-        return lambda: None
+class FlowHandler:
+    """Return flow results as plain dicts instead of driving a flow manager."""
 
-    event.async_track_point_in_utc_time = async_track_point_in_utc_time
+    def __init__(self) -> None:
+        self.hass: Any = None
+        self.context: dict[str, Any] = {}
 
-    update_coordinator = _ensure_module("homeassistant.helpers.update_coordinator")
+    def async_show_form(
+        self,
+        *,
+        step_id: str,
+        data_schema: Any = None,
+        errors: Dict[str, str] | None = None,
+    ) -> dict[str, Any]:
+        return {
+            "type": "form",
+            "step_id": step_id,
+            "data_schema": data_schema,
+            "errors": errors or {},
+        }
+
+    def async_create_entry(
+        self, *, title: str, data: dict[str, Any], **kwargs: Any
+    ) -> dict[str, Any]:
+        return {"type": "create_entry", "title": title, "data": data, **kwargs}
+
+    def async_abort(self, *, reason: str) -> dict[str, Any]:
+        return {"type": "abort", "reason": reason}
+
+
+class ConfigFlow(FlowHandler):
+    _domain: str | None = None
+    unique_id: str | None = None
+
+    def __init_subclass__(cls, domain: str | None = None, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if domain is not None:
+            cls._domain = domain
+
+    async def async_set_unique_id(self, unique_id: str | None = None) -> None:
+        self.unique_id = unique_id
+
+    def _async_current_entries(self) -> list[Any]:
+        return self.hass.config_entries.async_entries(self._domain)
+
+    def _abort_if_unique_id_configured(self) -> None:
+        for entry in self._async_current_entries():
+            if entry.unique_id == self.unique_id:
+                raise AbortFlow("already_configured")
+
+
+class OptionsFlow(FlowHandler):
+    pass
+
+
+class Platform(str, Enum):
+    SENSOR = "sensor"
+
+
+class ServiceValidationError(Exception):  # pragma: no cover - stub
+    def __init__(
+        self,
+        *args,
+        translation_domain: str | None = None,
+        translation_key: str | None = None,
+        translation_placeholders: Dict[str, Any] | None = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args)
+        self.translation_domain = translation_domain
+        self.translation_key = translation_key
+        self.translation_placeholders = translation_placeholders or {}
+
+
+# ----------------------------------------------------------------------
+# Core helpers
+
+
+class HassJob:  # pragma: no cover - minimal wrapper
+    def __init__(self, action: Callable) -> None:
+        self.action = action
+
+
+@dataclass
+class ServiceCall:  # pragma: no cover - unused stub
+    data: dict[str, Any]
+
+
+class ServiceResponse(dict):  # pragma: no cover - unused stub
+    pass
+
+
+class SupportsResponse(Enum):  # pragma: no cover - stub enum
+    ONLY = "only"
+
+
+def callback(func: Callable) -> Callable:  # pragma: no cover - stub decorator
+    return func
+
+
+class HomeAssistant:  # pragma: no cover - simple placeholder
+    def __init__(self) -> None:
+        self.data: dict[str, Any] = {}
+        self.loop = None
+
+    async def async_add_executor_job(self, func: Callable, *args, **kwargs):
+        return func(*args, **kwargs)
+
+
+# ----------------------------------------------------------------------
+# Helpers package
+
+
+class Template:
+    def __init__(self, template: str, hass: Any | None = None) -> None:
+        self.template = template
+        self.hass = hass
+
+    def async_render(self, *args, **kwargs):  # pragma: no cover - stub
+        return kwargs.get("current_price", self.template)
+
+
+def template(value):  # pragma: no cover - stub validator
+    if isinstance(value, Template):
+        return value
+    return Template(value)
+
+
+class DeviceEntryType:
+    SERVICE = "service"
+
+
+class DeviceInfo:
+    def __init__(self, **kwargs) -> None:
+        self.__dict__.update(kwargs)
 
-    class UpdateFailed(Exception):
-        pass
 
-    class DataUpdateCoordinator(Generic[T]):
-        def __init__(self, hass, logger, name: str, update_interval) -> None:
-            self.hass = hass
-            self.logger = logger
-            self.name = name
-            self.update_interval = update_interval
-            self.data: Any = None
+class ConfigEntrySelector:  # pragma: no cover - stub selector
+    def __init__(self, config: Dict[str, Any] | None = None) -> None:
+        self.config = config or {}
 
-        async def async_config_entry_first_refresh(self):  # pragma: no cover - stub
-            self.data = await self._async_update_data()
 
-    class CoordinatorEntity(Generic[T]):
-        def __init__(self, coordinator: DataUpdateCoordinator) -> None:
-            self.coordinator = coordinator
-            self.hass = getattr(coordinator, "hass", None)
+class SelectOptionDict(dict):
+    pass
 
-        async def async_added_to_hass(self) -> None:
-            """Handle entity added to hass (mock)."""
-            return None
 
-        @property
-        def available(self) -> bool:  # pragma: no cover - stub
-            return True
+class SelectSelectorConfig(dict):
+    pass
 
-    update_coordinator.UpdateFailed = UpdateFailed
-    update_coordinator.DataUpdateCoordinator = DataUpdateCoordinator
-    update_coordinator.CoordinatorEntity = CoordinatorEntity
 
-    # ------------------------------------------------------------------
-    # Utilities
-    util = _ensure_module("homeassistant.util")
+class SelectSelector:
+    def __init__(self, config: SelectSelectorConfig) -> None:
+        self.config = config
 
-    def utcnow():
-        return datetime.now(timezone.utc)
 
-    util.utcnow = utcnow
+async def async_track_point_in_utc_time(  # pragma: no cover - stub
+    hass, job: Callable[..., Awaitable], when
+):
+    return lambda: None
 
-    dt_module = _ensure_module("homeassistant.util.dt")
 
-    def now():
-        return datetime.now().astimezone()
+class UpdateFailed(Exception):
+    pass
 
-    dt_module.now = now
 
-    # ------------------------------------------------------------------
-    # Voluptuous stub used in service schema
-    voluptuous = _ensure_module("voluptuous")
+class DataUpdateCoordinator(Generic[T]):
+    def __init__(self, hass, logger, name: str, update_interval) -> None:
+        self.hass = hass
+        self.logger = logger
+        self.name = name
+        self.update_interval = update_interval
+        self.data: Any = None
 
-    class Schema:
-        def __init__(self, schema: Dict[str, Any]) -> None:
-            self.schema = schema
+    async def async_config_entry_first_refresh(self):  # pragma: no cover - stub
+        self.data = await self._async_update_data()
 
-        def __call__(self, value: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - stub
-            return value
+    async def async_shutdown(self) -> None:  # pragma: no cover - stub
+        return None
 
-    def Required(key):  # pragma: no cover - stub
-        return key
 
-    def Optional(key):  # pragma: no cover - stub
-        return key
+class CoordinatorEntity(Generic[T]):
+    def __init__(self, coordinator: DataUpdateCoordinator) -> None:
+        self.coordinator = coordinator
+        self.hass = getattr(coordinator, "hass", None)
 
-    voluptuous.Schema = Schema
-    voluptuous.Required = Required
-    voluptuous.Optional = Optional
+    async def async_added_to_hass(self) -> None:
+        """Handle entity added to hass (mock)."""
+        return None
 
-    # ------------------------------------------------------------------
-    # Jinja2 stub
-    jinja2 = _ensure_module("jinja2")
+    async def async_will_remove_from_hass(self) -> None:
+        """Handle entity removal from hass (mock)."""
+        return None
 
-    def pass_context(func: Callable) -> Callable:  # pragma: no cover - stub
-        return func
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator (mock)."""
+        return None
 
-    jinja2.pass_context = pass_context
+    @property
+    def available(self) -> bool:  # pragma: no cover - stub
+        return True
 
-    # ------------------------------------------------------------------
-    # Requests stub (provides HTTPError used in coordinators)
-    requests = _ensure_module("requests")
-    exceptions = _ensure_module("requests.exceptions")
 
-    class _Response:
-        def __init__(self, status_code: int = 0) -> None:
-            self.status_code = status_code
+# ----------------------------------------------------------------------
+# Utilities
 
-    class HTTPError(Exception):
-        def __init__(self, response: Any | None = None) -> None:
-            super().__init__("HTTPError")
-            self.response = response or _Response()
 
-    class RequestException(Exception):
-        """Base requests exception used by the integration."""
+def utcnow():
+    return datetime.now(timezone.utc)
 
-    class ConnectionError(RequestException):
-        """Connection error for requests."""
 
-    class Timeout(RequestException):
-        """Timeout exception for requests."""
+def now():
+    return datetime.now().astimezone()
 
-    class ReadTimeout(Timeout):
-        """Read timeout exception for requests."""
 
-    class ConnectTimeout(Timeout):
-        """Connection timeout exception for requests."""
+# ----------------------------------------------------------------------
+# Voluptuous stub used in service schema
 
-    exceptions.HTTPError = HTTPError
-    exceptions.RequestException = RequestException
-    exceptions.ConnectionError = ConnectionError
-    exceptions.Timeout = Timeout
-    exceptions.ReadTimeout = ReadTimeout
-    exceptions.ConnectTimeout = ConnectTimeout
-    requests.exceptions = exceptions
 
-    class Session:  # pragma: no cover - stub
-        def __init__(self) -> None:
-            self.mount_calls: list[tuple[str, Any]] = []
+class Schema:
+    def __init__(self, schema: Dict[str, Any]) -> None:
+        self.schema = schema
 
-        def get(self, *args: Any, **kwargs: Any) -> Any:
-            raise NotImplementedError
+    def __call__(self, value: Dict[str, Any]) -> Dict[str, Any]:  # pragma: no cover - stub
+        return value
 
-        def mount(self, prefix: str, adapter: Any) -> None:
-            self.mount_calls.append((prefix, adapter))
 
-    requests.Session = Session
+class _Undefined:
+    def __repr__(self) -> str:
+        return "UNDEFINED"
 
-    adapters_mod = _ensure_module("requests.adapters")
 
-    class HTTPAdapter:  # pragma: no cover - stub
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
+UNDEFINED = _Undefined()
 
-    adapters_mod.HTTPAdapter = HTTPAdapter
-    requests.adapters = adapters_mod
 
-    urllib3 = _ensure_module("urllib3")
-    urllib3_util = _ensure_module("urllib3.util")
-    retry_mod = _ensure_module("urllib3.util.retry")
+class _Marker:
+    """Schema key recording its default, compared and hashed like the key."""
 
-    class Retry:  # pragma: no cover - stub
-        def __init__(self, *args: Any, **kwargs: Any) -> None:
-            pass
+    def __init__(self, schema: Any, default: Any = UNDEFINED) -> None:
+        self.schema = schema
+        self.default = default
 
-    retry_mod.Retry = Retry
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, _Marker):
+            return self.schema == other.schema
+        return self.schema == other
 
-    # ------------------------------------------------------------------
-    # pytz stub used by the API client
-    pytz = _ensure_module("pytz")
-    pytz.UTC = timezone.utc
+    def __hash__(self) -> int:
+        return hash(self.schema)
+
+
+class Required(_Marker):
+    pass
+
+
+class Optional(_Marker):
+    pass
+
+
+def Coerce(type_: type) -> Callable[[Any], Any]:  # pragma: no cover - stub
+    return type_
+
+
+# ----------------------------------------------------------------------
+# Jinja2 stub
+
+
+def pass_context(func: Callable) -> Callable:  # pragma: no cover - stub
+    return func
+
+
+# ----------------------------------------------------------------------
+# Requests stub (provides HTTPError used in coordinators)
+
+
+class _Response:
+    def __init__(self, status_code: int = 0) -> None:
+        self.status_code = status_code
+
+
+class HTTPError(Exception):
+    def __init__(self, response: Any | None = None) -> None:
+        super().__init__("HTTPError")
+        self.response = response or _Response()
+
+
+class RequestException(Exception):
+    """Base requests exception used by the integration."""
+
+
+class ConnectionError(RequestException):
+    """Connection error for requests."""
+
+
+class Timeout(RequestException):
+    """Timeout exception for requests."""
+
+
+class ReadTimeout(Timeout):
+    """Read timeout exception for requests."""
+
+
+class ConnectTimeout(Timeout):
+    """Connection timeout exception for requests."""
+
+
+class Session:  # pragma: no cover - stub
+    def __init__(self) -> None:
+        self.mount_calls: list[tuple[str, Any]] = []
+
+    def get(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError
+
+    def mount(self, prefix: str, adapter: Any) -> None:
+        self.mount_calls.append((prefix, adapter))
+
+
+class HTTPAdapter:  # pragma: no cover - stub
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+class Retry:  # pragma: no cover - stub
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+# ----------------------------------------------------------------------
+# Module table: ``(name, is_package, attributes)``.  Parents are listed
+# before their children so submodules can be bound onto their package.
+# Only stubs created here are marked as packages; modules that are already
+# imported keep their own ``__path__``.
+
+_STUB_MODULES: tuple[tuple[str, bool, Dict[str, Any]], ...] = (
+    ("homeassistant", True, {}),
+    ("homeassistant.components", True, {}),
+    (
+        "homeassistant.components.sensor",
+        False,
+        {
+            "SensorDeviceClass": SensorDeviceClass,
+            "SensorStateClass": SensorStateClass,
+            "SensorEntityDescription": SensorEntityDescription,
+            "RestoreSensor": RestoreSensor,
+            "SensorData": SensorData,
+        },
+    ),
+    (
+        "homeassistant.config_entries",
+        False,
+        {
+            "ConfigEntry": ConfigEntry,
+            "ConfigEntryState": ConfigEntryState,
+            "ConfigFlow": ConfigFlow,
+            "OptionsFlow": OptionsFlow,
+            "SOURCE_RECONFIGURE": "reconfigure",
+        },
+    ),
+    (
+        "homeassistant.const",
+        False,
+        {"PERCENTAGE": "%", "CURRENCY_EURO": "EUR", "Platform": Platform},
+    ),
+    (
+        "homeassistant.data_entry_flow",
+        False,
+        {"AbortFlow": AbortFlow, "FlowResult": Dict[str, Any]},
+    ),
+    (
+        "homeassistant.exceptions",
+        False,
+        {"ServiceValidationError": ServiceValidationError},
+    ),
+    (
+        "homeassistant.core",
+        False,
+        {
+            "HassJob": HassJob,
+            "ServiceCall": ServiceCall,
+            "ServiceResponse": ServiceResponse,
+            "SupportsResponse": SupportsResponse,
+            "callback": callback,
+            "HomeAssistant": HomeAssistant,
+        },
+    ),
+    ("homeassistant.helpers", True, {}),
+    ("homeassistant.helpers.template", False, {"Template": Template}),
+    ("homeassistant.helpers.config_validation", False, {"template": template}),
+    (
+        "homeassistant.helpers.device_registry",
+        False,
+        {"DeviceEntryType": DeviceEntryType, "DeviceInfo": DeviceInfo},
+    ),
+    (
+        "homeassistant.helpers.entity_platform",
+        False,
+        {"AddEntitiesCallback": Callable},
+    ),
+    (
+        "homeassistant.helpers.typing",
+        False,
+        {"StateType": Any, "ConfigType": Dict[str, Any]},
+    ),
+    (
+        "homeassistant.helpers.selector",
+        False,
+        {
+            "ConfigEntrySelector": ConfigEntrySelector,
+            "SelectOptionDict": SelectOptionDict,
+            "SelectSelector": SelectSelector,
+            "SelectSelectorConfig": SelectSelectorConfig,
+        },
+    ),
+    (
+        "homeassistant.helpers.event",
+        False,
+        {"async_track_point_in_utc_time": async_track_point_in_utc_time},
+    ),
+    (
+        "homeassistant.helpers.update_coordinator",
+        False,
+        {
+            "UpdateFailed": UpdateFailed,
+            "DataUpdateCoordinator": DataUpdateCoordinator,
+            "CoordinatorEntity": CoordinatorEntity,
+        },
+    ),
+    ("homeassistant.util", False, {"utcnow": utcnow}),
+    ("homeassistant.util.dt", False, {"now": now}),
+    (
+        "voluptuous",
+        False,
+        {
+            "Schema": Schema,
+            "Required": Required,
+            "Optional": Optional,
+            "Coerce": Coerce,
+            "UNDEFINED": UNDEFINED,
+        },
+    ),
+    ("jinja2", False, {"pass_context": pass_context}),
+    ("requests", False, {"Session": Session}),
+    (
+        "requests.exceptions",
+        False,
+        {
+            "HTTPError": HTTPError,
+            "RequestException": RequestException,
+            "ConnectionError": ConnectionError,
+            "Timeout": Timeout,
+            "ReadTimeout": ReadTimeout,
+            "ConnectTimeout": ConnectTimeout,
+        },
+    ),
+    ("requests.adapters", False, {"HTTPAdapter": HTTPAdapter}),
+    ("urllib3", False, {}),
+    ("urllib3.util", False, {}),
+    ("urllib3.util.retry", False, {"Retry": Retry}),
+)
+
+
+def install_hass_stubs() -> None:
+    """Install Home Assistant and Jinja2 stubs used during testing.
+
+    The stubs are installed at most once per process; repeated calls (from
+    ``conftest`` and the integration's import fallback) are no-ops.
+    """
+
+    global _STUBS_INSTALLED
+
+    if _STUBS_INSTALLED or "homeassistant" in sys.modules:
+        _STUBS_INSTALLED = True
+        return
+    _STUBS_INSTALLED = True
+
+    for name, is_package, attrs in _STUB_MODULES:
+        module = _ensure_module(name, is_package)
+        module.__dict__.update(attrs)
+        parent, _, child = name.rpartition(".")
+        if parent:
+            setattr(sys.modules[parent], child, module)
 
 
 __all__ = ["install_hass_stubs"]
@@ -3,7 +3,7 @@ import os
 import sys
 import unittest
 import zipfile
-from datetime import datetime
+from datetime import datetime, timezone
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -167,7 +167,7 @@ class TestDocumentParsing(unittest.TestCase):
         sleep_mock.assert_not_called()
         
         # Second request - delay expected since only elapsed_time seconds passed
-        client._base_request({}, datetime(2024, 10, 7), datetime(2024, 10, 8))
+        client._base_request({}, datetime(2024, 10, 8), datetime(2024, 10, 9))
         sleep_mock.assert_called_once()
         
         # Verify the delay is REQUEST_DELAY - elapsed_time
@@ -175,6 +175,51 @@ class TestDocumentParsing(unittest.TestCase):
         called_delay = sleep_mock.call_args[0][0]
         self.assertAlmostEqual(called_delay, expected_delay, places=5)
 
+    @patch("custom_components.entsoe_data.api_client.time.sleep")
+    @patch("custom_components.entsoe_data.api_client.requests.Session")
+    def test_base_request_warns_on_non_200_success(self, session_cls, sleep_mock):
+        session = session_cls.return_value
+        response = MagicMock(status_code=204)
+        session.get.return_value = response
+
+        client = EntsoeClient("fake-key")
+        start, end = datetime(2024, 10, 7), datetime(2024, 10, 8)
+
+        with self.assertLogs(
+            "custom_components.entsoe_data.api_client", level="WARNING"
+        ) as logs:
+            result = client._base_request({"documentType": "A65"}, start, end)
+
+        self.assertIs(result, response)
+        self.assertIn("HTTP 204", logs.output[0])
+
+    @patch("custom_components.entsoe_data.api_client.time.sleep")
+    @patch("custom_components.entsoe_data.api_client.time.monotonic")
+    @patch("custom_components.entsoe_data.api_client.requests.Session")
+    def test_base_request_reuses_recent_identical_response(
+        self, session_cls, monotonic_mock, sleep_mock
+    ):
+        from custom_components.entsoe_data.api_client import RESPONSE_CACHE_TTL
+
+        session = session_cls.return_value
+        session.get.return_value = MagicMock(status_code=200)
+        monotonic_mock.return_value = 1000.0
+
+        client = EntsoeClient("fake-key")
+        start, end = datetime(2024, 10, 7), datetime(2024, 10, 8)
+
+        first = client._base_request({"documentType": "A65"}, start, end)
+        self.assertIs(client._base_request({"documentType": "A65"}, start, end), first)
+        self.assertEqual(session.get.call_count, 1)
+        sleep_mock.assert_not_called()
+
+        client._base_request({"documentType": "A69"}, start, end)
+        self.assertEqual(session.get.call_count, 2)
+
+        monotonic_mock.return_value = 1000.0 + RESPONSE_CACHE_TTL
+        client._base_request({"documentType": "A65"}, start, end)
+        self.assertEqual(session.get.call_count, 3)
+
     def test_query_total_load_forecast_handles_zip_payload(self):
         xml_doc = """
         <?xml version="1.0" encoding="UTF-8"?>
@@ -750,6 +795,32 @@ class TestDocumentParsing(unittest.TestCase):
             },
         )
 
+    def test_parse_reuses_result_for_identical_document(self):
+        with open(DATASET_DIR / "BE_total_load.xml") as f:
+            document = f.read()
+
+        first = self.client.parse_total_load_document(document)
+        self.assertIs(self.client.parse_total_load_document(document), first)
+        self.assertIs(self.client.parse_total_load_document(document.encode()), first)
+        self.assertIsNot(
+            self.client.parse_generation_forecast_document(document), first
+        )
+
+    def test_parse_timestamp_matches_strptime(self):
+        value = "2024-10-27T01:15Z"
+        expected = (
+            datetime.strptime(value, "%Y-%m-%dT%H:%MZ")
+            .replace(tzinfo=timezone.utc)
+            .astimezone()
+        )
+
+        parsed = self.client._parse_timestamp(value)
+        self.assertEqual(parsed, expected)
+        self.assertEqual(parsed.utcoffset(), expected.utcoffset())
+        self.assertIs(EntsoeClient("other-key")._parse_timestamp(value), parsed)
+        with self.assertRaises(ValueError):
+            self.client._parse_timestamp("2024-10-27T01:15:00Z")
+
     def test_query_generation_per_type_uses_process_mapping(self):
         response = MagicMock()
         response.status_code = 200
@@ -868,6 +939,16 @@ class TestDocumentParsing(unittest.TestCase):
 
         self.assertEqual(area, Area["TOTAL_EUROPE"])
 
+    def test_area_from_identifier_accepts_any_spelling(self):
+        self.assertIs(Area.from_identifier(Area.BE), Area.BE)
+        self.assertIs(Area.from_identifier("be"), Area.BE)
+        self.assertIs(Area.from_identifier("10YBE----------2"), Area.BE)
+        self.assertIs(Area.from_identifier("10ybe----------2"), Area.BE)
+        with self.assertRaises(KeyError):
+            Area.from_identifier("nowhere")
+        with self.assertRaises(KeyError):
+            Area.from_identifier(None)
+
     def test_area_has_code_accepts_eic_code(self):
         self.assertTrue(Area.has_code("10Y1001A1001A876"))
 
@@ -0,0 +1,193 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+PACKAGE_ROOT = Path(__file__).resolve().parents[3]
+sys.path.append(str(PACKAGE_ROOT))
+
+from voluptuous import UNDEFINED
+
+from custom_components.entsoe_data.config_flow import (
+    SENSOR_FLAG_KEYS,
+    EntsoeFlowHandler,
+    EntsoeOptionFlowHandler,
+)
+from custom_components.entsoe_data.const import (
+    CONF_API_KEY,
+    CONF_AREA,
+    CONF_ENABLE_EUROPE_LOAD,
+    CONF_ENABLE_GENERATION,
+    CONF_ENABLE_LOAD,
+    CONF_ENABLE_LOAD_TOTAL_EUROPE,
+    DEFAULT_ENABLE_GENERATION,
+    DOMAIN,
+    UNIQUE_ID,
+)
+
+
+class DummyConfigEntries:
+    def __init__(self, entries=()):
+        self.entries = {entry.entry_id: entry for entry in entries}
+        self.updates: list[dict] = []
+        self.async_reload = AsyncMock(return_value=True)
+
+    def async_entries(self, domain=None):
+        return list(self.entries.values())
+
+    def async_get_entry(self, entry_id):
+        return self.entries.get(entry_id)
+
+    def async_entry_for_domain_unique_id(self, domain, unique_id):
+        assert domain == DOMAIN
+        for entry in self.entries.values():
+            if entry.unique_id == unique_id:
+                return entry
+        return None
+
+    def async_update_entry(self, entry, **changes):
+        self.updates.append(changes)
+        for key, value in changes.items():
+            setattr(entry, key, value)
+        return True
+
+
+def _entry(entry_id, area, **options):
+    return SimpleNamespace(
+        entry_id=entry_id,
+        unique_id=f"{area}_{UNIQUE_ID}",
+        title=area,
+        options={CONF_API_KEY: "stored-key", CONF_AREA: area, **options},
+    )
+
+
+def _flow(entries=(), source="user", entry_id=None):
+    flow = EntsoeFlowHandler()
+    flow.hass = SimpleNamespace(config_entries=DummyConfigEntries(entries))
+    flow.context = {"source": source}
+    if entry_id is not None:
+        flow.context["entry_id"] = entry_id
+    return flow
+
+
+def _form_defaults(result):
+    return {marker.schema: marker.default for marker in result["data_schema"].schema}
+
+
+def _submission(area, api_key=" new-key "):
+    return {
+        CONF_API_KEY: api_key,
+        CONF_AREA: area,
+        **dict.fromkeys(SENSOR_FLAG_KEYS, False),
+        CONF_ENABLE_LOAD: True,
+    }
+
+
+def test_user_step_shows_form_without_area_default():
+    result = asyncio.run(_flow().async_step_user())
+
+    assert result["type"] == "form"
+    assert result["step_id"] == "user"
+    defaults = _form_defaults(result)
+    assert defaults[CONF_API_KEY] == ""
+    assert defaults[CONF_AREA] is UNDEFINED
+    assert defaults[CONF_ENABLE_GENERATION] is DEFAULT_ENABLE_GENERATION
+    assert list(defaults)[2:] == list(SENSOR_FLAG_KEYS)
+
+
+def test_user_step_creates_entry():
+    flow = _flow()
+
+    result = asyncio.run(flow.async_step_user(_submission("BE")))
+
+    assert result["type"] == "create_entry"
+    assert result["title"] == "Belgium"
+    assert result["data"] == {}
+    assert result["options"][CONF_API_KEY] == "new-key"
+    assert result["options"][CONF_AREA] == "BE"
+    assert result["options"][CONF_ENABLE_LOAD] is True
+    assert result["options"][CONF_ENABLE_GENERATION] is False
+    assert flow.unique_id == f"BE_{UNIQUE_ID}"
+
+
+def test_user_step_rejects_configured_area():
+    flow = _flow([_entry("existing", "BE")])
+
+    result = asyncio.run(flow.async_step_user(_submission("BE")))
+
+    assert result["type"] == "form"
+    assert result["errors"] == {"base": "already_configured"}
+    assert _form_defaults(result)[CONF_AREA] == "BE"
+
+
+def test_options_step_uses_entry_options_as_defaults():
+    entry = _entry("entry", "NL", **{CONF_ENABLE_LOAD_TOTAL_EUROPE: True})
+    flow = EntsoeOptionFlowHandler(entry)
+
+    result = asyncio.run(flow.async_step_init())
+
+    assert result["step_id"] == "init"
+    defaults = _form_defaults(result)
+    assert defaults[CONF_API_KEY] == "stored-key"
+    assert defaults[CONF_AREA] == "NL"
+    assert defaults[CONF_ENABLE_EUROPE_LOAD] is True
+
+    result = asyncio.run(flow.async_step_init(_submission("NL")))
+
+    assert result["type"] == "create_entry"
+    assert result["data"][CONF_API_KEY] == "new-key"
+    assert result["data"][CONF_ENABLE_LOAD] is True
+    assert result["data"][CONF_ENABLE_EUROPE_LOAD] is False
+
+
+def test_reconfigure_step_shows_entry_options():
+    entry = _entry("entry", "BE")
+    flow = _flow([entry], source="reconfigure", entry_id="entry")
+
+    result = asyncio.run(flow.async_step_reconfigure())
+
+    assert result["type"] == "form"
+    assert result["step_id"] == "reconfigure"
+    assert _form_defaults(result)[CONF_AREA] == "BE"
+
+
+def test_reconfigure_step_updates_entry_and_reloads():
+    entry = _entry("entry", "BE")
+    flow = _flow([entry], source="reconfigure", entry_id="entry")
+    config_entries = flow.hass.config_entries
+
+    result = asyncio.run(flow.async_step_reconfigure(_submission("NL")))
+
+    assert result == {"type": "abort", "reason": "reconfigure_successful"}
+    assert entry.title == "Netherlands"
+    assert entry.unique_id == f"NL_{UNIQUE_ID}"
+    assert entry.options[CONF_AREA] == "NL"
+    assert entry.options[CONF_API_KEY] == "new-key"
+    config_entries.async_reload.assert_awaited_once_with("entry")
+
+
+def test_reconfigure_step_keeps_own_area():
+    entry = _entry("entry", "BE")
+    flow = _flow([entry], source="reconfigure", entry_id="entry")
+
+    result = asyncio.run(flow.async_step_reconfigure(_submission("BE")))
+
+    assert result["reason"] == "reconfigure_successful"
+    assert entry.unique_id == f"BE_{UNIQUE_ID}"
+
+
+def test_reconfigure_step_rejects_area_of_other_entry():
+    entry = _entry("entry", "BE")
+    other = _entry("other", "NL")
+    flow = _flow([entry, other], source="reconfigure", entry_id="entry")
+    config_entries = flow.hass.config_entries
+
+    result = asyncio.run(flow.async_step_reconfigure(_submission("NL")))
+
+    assert result["type"] == "form"
+    assert result["step_id"] == "reconfigure"
+    assert result["errors"] == {"base": "already_configured"}
+    assert config_entries.updates == []
+    assert config_entries.async_reload.await_count == 0
+    assert entry.options[CONF_AREA] == "BE"
@@ -1,6 +1,7 @@
 import asyncio
 import sys
-from datetime import datetime, timedelta
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -26,6 +27,7 @@ from custom_components.entsoe_data.coordinator import (
     EntsoeGenerationForecastCoordinator,
     EntsoeLoadCoordinator,
     EntsoeWindSolarForecastCoordinator,
+    _next_hour,
 )
 from custom_components.entsoe_data.sensor import (
     TOTAL_GENERATION_KEY,
@@ -33,6 +35,7 @@ from custom_components.entsoe_data.sensor import (
     EntsoeGenerationForecastSensor,
     EntsoeLoadSensor,
     EntsoeWindSolarForecastSensor,
+    _create_load_sensors,
     generation_forecast_sensor_descriptions,
     generation_sensor_descriptions,
     generation_total_europe_descriptions,
@@ -69,7 +72,7 @@ def patch_track_point(monkeypatch):
         return lambda: None
 
     monkeypatch.setattr(
-        "custom_components.entsoe_data.sensor.event.async_track_point_in_utc_time",
+        "custom_components.entsoe_data.coordinator.event.async_track_point_in_utc_time",
         _fake_track_point,
     )
 
@@ -155,6 +158,9 @@ def test_generation_coordinator_total_europe_aggregates(monkeypatch, hass):
     assert values["nuclear"] == pytest.approx(300.0)
     assert values[TOTAL_GENERATION_KEY] == pytest.approx(650.0)
     assert TOTAL_GENERATION_KEY in coordinator.categories()
+    assert coordinator.get_area_timeline("FR", TOTAL_GENERATION_KEY) == {
+        timestamp.isoformat(): pytest.approx(500.0)
+    }
 
 
 def test_wind_solar_coordinator_total_europe_aggregates(monkeypatch, hass):
@@ -321,6 +327,138 @@ def test_load_sensor_descriptions_include_horizons():
     )
 
 
+def test_load_sensor_descriptions_are_cached():
+    assert load_sensor_descriptions(LOAD_FORECAST_HORIZON_WEEK_AHEAD) is (
+        load_sensor_descriptions(LOAD_FORECAST_HORIZON_WEEK_AHEAD)
+    )
+    assert load_total_europe_descriptions() is load_total_europe_descriptions()
+
+
+def test_sensor_attributes_reused_until_data_changes(hass):
+    coordinator = EntsoeGenerationForecastCoordinator(hass, "test", "BE")
+    timestamp = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+    coordinator.data = {timestamp: 1450.0, timestamp + timedelta(hours=1): 1500.0}
+
+    attrs_fn = generation_forecast_sensor_descriptions()[0].attrs_fn
+    first = attrs_fn(coordinator)
+    assert attrs_fn(coordinator) is first
+
+    coordinator.data = {timestamp: 1460.0, timestamp + timedelta(hours=1): 1500.0}
+    refreshed = attrs_fn(coordinator)
+    assert refreshed is not first
+    assert refreshed["timeline"][timestamp.isoformat()] == 1460.0
+
+
+def test_timestamp_window_follows_clock_and_data(monkeypatch, hass):
+    coordinator = EntsoeLoadCoordinator(hass, "test", "BE")
+    base = datetime(2024, 1, 1, 12, tzinfo=datetime.now().astimezone().tzinfo)
+    coordinator.data = {base + timedelta(hours=offset): float(offset) for offset in range(3)}
+
+    clock = {"now": base + timedelta(minutes=30)}
+    monkeypatch.setattr(
+        "custom_components.entsoe_data.coordinator.dt.now", lambda: clock["now"]
+    )
+
+    assert coordinator.current_timestamp() == base
+    assert coordinator.next_timestamp() == base + timedelta(hours=1)
+
+    clock["now"] = base + timedelta(hours=1, minutes=5)
+    assert coordinator.current_timestamp() == base + timedelta(hours=1)
+    assert coordinator.next_timestamp() == base + timedelta(hours=2)
+
+    clock["now"] = base - timedelta(hours=1)
+    assert coordinator.current_timestamp() == base
+    assert coordinator.next_timestamp() == base
+
+    coordinator.data = {base + timedelta(hours=5): 5.0}
+    assert coordinator.current_timestamp() == base + timedelta(hours=5)
+    assert coordinator.next_timestamp() == base + timedelta(hours=5)
+
+
+def test_client_jobs_run_on_hass_executor(monkeypatch, hass):
+    coordinator = EntsoeLoadCoordinator(hass, "test", "BE")
+    threads_before = set(threading.enumerate())
+    jobs = []
+    run_job = hass.async_add_executor_job
+
+    async def _record_job(func, *args, **kwargs):
+        jobs.append(func)
+        return await run_job(func, *args, **kwargs)
+
+    def _fake_query(area, start, end, process_type):
+        return {}
+
+    monkeypatch.setattr(hass, "async_add_executor_job", _record_job)
+    monkeypatch.setattr(coordinator._client, "query_total_load_forecast", _fake_query)
+
+    asyncio.run(coordinator._async_update_data())
+    asyncio.run(coordinator.async_shutdown())
+
+    assert jobs == [_fake_query]
+    assert set(threading.enumerate()) <= threads_before
+
+
+def test_async_shutdown_cancels_hourly_tick(monkeypatch, hass):
+    coordinator = EntsoeLoadCoordinator(hass, "test", "BE")
+    cancelled = []
+
+    monkeypatch.setattr(
+        "custom_components.entsoe_data.coordinator.event.async_track_point_in_utc_time",
+        lambda hass, job, when: lambda: cancelled.append(job),
+    )
+
+    coordinator.async_add_hourly_listener(lambda: None)
+    asyncio.run(coordinator.async_shutdown())
+
+    assert len(cancelled) == 1
+    assert coordinator._unsub_hourly is None
+
+
+def test_category_timelines_built_once_per_data_version(hass):
+    coordinator = EntsoeWindSolarForecastCoordinator(hass, "test", "BE")
+    timestamp = datetime(2024, 1, 1, 12, tzinfo=datetime.now().astimezone().tzinfo)
+    later = timestamp + timedelta(hours=1)
+    coordinator.data = {
+        later: {"solar": 2.0},
+        timestamp: {"solar": 1.0, "wind_onshore": 5.0},
+    }
+
+    solar = coordinator.timeline("solar")
+    assert list(solar) == [timestamp.isoformat(), later.isoformat()]
+    assert coordinator.timeline("wind_onshore") == {timestamp.isoformat(): 5.0}
+    assert coordinator.timeline("solar") is solar
+    assert coordinator.timeline("hydro") == {}
+
+    coordinator.data = {timestamp: {"solar": 3.0}}
+    assert coordinator.timeline("solar") == {timestamp.isoformat(): 3.0}
+
+
+def test_area_timelines_built_once_per_data_version(hass):
+    coordinator = EntsoeWindSolarForecastCoordinator(hass, "test", "BE")
+    timestamp = datetime(2024, 1, 1, 12, tzinfo=datetime.now().astimezone().tzinfo)
+    coordinator._area_data = {
+        "BE": {timestamp: {"solar": 1.0}},
+        "NL": {timestamp: {"solar": 2.0, "wind_onshore": 4.0}},
+    }
+    coordinator.data = {timestamp: {"solar": 3.0, "wind_onshore": 4.0}}
+
+    solar = coordinator.get_all_area_timelines("solar")
+    assert solar == {
+        "BE": {timestamp.isoformat(): 1.0},
+        "NL": {timestamp.isoformat(): 2.0},
+    }
+    assert coordinator.get_all_area_timelines("solar") is solar
+    assert coordinator.get_all_area_timelines("wind_onshore") == {
+        "NL": {timestamp.isoformat(): 4.0}
+    }
+
+    coordinator._area_data = {"BE": {timestamp: {"solar": 5.0}}}
+    coordinator.data = {timestamp: {"solar": 5.0}}
+    assert coordinator.get_all_area_timelines("solar") == {
+        "BE": {timestamp.isoformat(): 5.0}
+    }
+
+
 def test_load_coordinator_total_europe_aggregates(monkeypatch, hass):
     minimal_area_info = {
         TOTAL_EUROPE_AREA: {"code": "10Y1001A1001A876"},
@@ -574,6 +712,29 @@ def test_total_europe_load_sensor_grouping(hass):
     assert sensor.native_value == 18250.0
 
 
+def test_load_sensors_share_device_info(hass):
+    coordinator = EntsoeLoadCoordinator(hass, "test", "BE")
+    timestamp = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+    coordinator.data = {timestamp: 9100.0}
+
+    config_entry = type(
+        "ConfigEntry",
+        (),
+        {
+            "entry_id": "entry",
+            "options": {CONF_AREA: "BE"},
+        },
+    )()
+
+    sensors = _create_load_sensors(config_entry, coordinator)
+
+    assert len(sensors) == len(load_sensor_descriptions())
+    device_info = sensors[0]._attr_device_info
+    assert all(sensor._attr_device_info is device_info for sensor in sensors)
+    assert device_info.identifiers == {(DOMAIN, "entry_load")}
+    assert device_info.name == "ENTSO-e Load forecast (Belgium)"
+
+
 def test_load_coordinator_handles_http_400(monkeypatch, hass):
     coordinator = EntsoeLoadCoordinator(hass, "test", "BE")
 
@@ -624,6 +785,118 @@ def test_generation_forecast_sensor_attrs(hass):
     assert attrs["next_value"] == 1500.0
 
 
+def test_hourly_sensor_reuses_scheduled_update(monkeypatch, hass):
+    coordinator = EntsoeGenerationForecastCoordinator(hass, "test", "BE")
+    timestamp = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+    coordinator.data = {timestamp: 1450.0}
+
+    registrations: list[datetime] = []
+
+    def _fake_track_point(hass, job, when):
+        registrations.append(when)
+        return lambda: None
+
+    monkeypatch.setattr(
+        "custom_components.entsoe_data.coordinator.event.async_track_point_in_utc_time",
+        _fake_track_point,
+    )
+
+    config_entry = type(
+        "ConfigEntry",
+        (),
+        {
+            "entry_id": "entry",
+            "options": {CONF_AREA: "BE"},
+        },
+    )()
+
+    sensor = EntsoeGenerationForecastSensor(
+        coordinator, generation_forecast_sensor_descriptions()[0], config_entry, "Belgium"
+    )
+    sensor.hass = hass
+
+    asyncio.run(sensor.async_update())
+    asyncio.run(sensor.async_update())
+
+    assert len(registrations) == 1
+    assert registrations[0].minute == 0
+
+
+def test_hourly_tick_shared_by_coordinator_sensors(monkeypatch, hass):
+    coordinator = EntsoeGenerationForecastCoordinator(hass, "test", "BE")
+    jobs = []
+    cancelled = []
+
+    def _fake_track_point(hass, job, when):
+        jobs.append(job)
+        return lambda: cancelled.append(job)
+
+    monkeypatch.setattr(
+        "custom_components.entsoe_data.coordinator.event.async_track_point_in_utc_time",
+        _fake_track_point,
+    )
+
+    config_entry = SimpleNamespace(entry_id="entry", options={CONF_AREA: "BE"})
+    description = generation_forecast_sensor_descriptions()[0]
+    sensors = [
+        EntsoeGenerationForecastSensor(coordinator, description, config_entry, "Belgium")
+        for _ in range(3)
+    ]
+    refreshed = []
+    for sensor in sensors:
+        sensor.hass = hass
+        sensor.async_schedule_update_ha_state = (
+            lambda force_refresh=False, sensor=sensor: refreshed.append(sensor)
+        )
+        asyncio.run(sensor.async_update())
+
+    assert len(jobs) == 1
+
+    jobs[0].action(datetime.now(timezone.utc))
+    assert refreshed == sensors
+    assert len(jobs) == 2
+
+    for sensor in sensors:
+        asyncio.run(sensor.async_will_remove_from_hass())
+    assert cancelled == [jobs[0]]
+
+
+def test_next_hour_floors_epoch_to_utc_hour(monkeypatch):
+    moment = datetime(2024, 3, 31, 1, 59, 59, tzinfo=timezone.utc)
+    monkeypatch.setattr(
+        "custom_components.entsoe_data.coordinator.time.time",
+        lambda: moment.timestamp() + 0.5,
+    )
+
+    assert _next_hour() == datetime(2024, 3, 31, 2, tzinfo=timezone.utc)
+
+
+def test_coordinator_push_updates_sensor_inline(hass):
+    coordinator = EntsoeGenerationForecastCoordinator(hass, "test", "BE")
+    timestamp = datetime.now().astimezone().replace(minute=0, second=0, microsecond=0)
+    coordinator.data = {timestamp: 1450.0}
+
+    config_entry = type(
+        "ConfigEntry",
+        (),
+        {
+            "entry_id": "entry",
+            "options": {CONF_AREA: "BE"},
+        },
+    )()
+
+    sensor = EntsoeGenerationForecastSensor(
+        coordinator, generation_forecast_sensor_descriptions()[0], config_entry, "Belgium"
+    )
+    sensor.hass = hass
+    hass.async_create_task = None  # a push must not spawn a follow-up task
+
+    sensor._handle_coordinator_update()
+
+    assert sensor.native_value == 1450.0
+    assert sensor.extra_state_attributes["timeline"] == coordinator.timeline()
+
+
 def test_generation_forecast_timeout_recovers_with_chunks(monkeypatch, hass):
     tzinfo = datetime.now().astimezone().tzinfo
     fake_now = datetime(2024, 10, 24, 12, tzinfo=tzinfo)
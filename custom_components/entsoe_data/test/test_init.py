@@ -5,6 +5,8 @@ from pathlib import Path
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
+import pytest
+
 PACKAGE_ROOT = Path(__file__).resolve().parents[3]
 sys.path.append(str(PACKAGE_ROOT))
 
@@ -52,6 +54,25 @@ class DummyCoordinator:
     async def async_config_entry_first_refresh(self):
         self.refresh_calls += 1
 
+    async def async_shutdown(self):
+        self.shutdown_calls = getattr(self, "shutdown_calls", 0) + 1
+
+
+def _patch_coordinator(monkeypatch, name, replacement):
+    """Make setup build ``replacement`` wherever it would build ``name``."""
+
+    monkeypatch.setattr(entsoe_init, name, replacement)
+    monkeypatch.setattr(
+        entsoe_init,
+        "_COORDINATOR_SPECS",
+        tuple(
+            spec._replace(coordinator_class=replacement)
+            if spec.coordinator_class.__name__ == name
+            else spec
+            for spec in entsoe_init._COORDINATOR_SPECS
+        ),
+    )
+
 
 def test_async_setup_entry_creates_total_europe_coordinators(monkeypatch):
     hass = SimpleNamespace()
@@ -75,10 +96,10 @@ def test_async_setup_entry_creates_total_europe_coordinators(monkeypatch):
     load_stub = DummyCoordinator
     wind_solar_stub = DummyCoordinator
 
-    monkeypatch.setattr(entsoe_init, "EntsoeGenerationCoordinator", generation_stub)
-    monkeypatch.setattr(entsoe_init, "EntsoeLoadCoordinator", load_stub)
-    monkeypatch.setattr(
-        entsoe_init, "EntsoeWindSolarForecastCoordinator", wind_solar_stub
+    _patch_coordinator(monkeypatch, "EntsoeGenerationCoordinator", generation_stub)
+    _patch_coordinator(monkeypatch, "EntsoeLoadCoordinator", load_stub)
+    _patch_coordinator(
+        monkeypatch, "EntsoeWindSolarForecastCoordinator", wind_solar_stub
     )
 
     result = asyncio.run(entsoe_init.async_setup_entry(hass, entry))
@@ -129,13 +150,13 @@ def test_async_setup_entry_creates_additional_load_horizons(monkeypatch):
         created.append(coordinator)
         return coordinator
 
-    monkeypatch.setattr(entsoe_init, "EntsoeLoadCoordinator", load_stub)
-    monkeypatch.setattr(entsoe_init, "EntsoeGenerationCoordinator", DummyCoordinator)
-    monkeypatch.setattr(
-        entsoe_init, "EntsoeGenerationForecastCoordinator", DummyCoordinator
+    _patch_coordinator(monkeypatch, "EntsoeLoadCoordinator", load_stub)
+    _patch_coordinator(monkeypatch, "EntsoeGenerationCoordinator", DummyCoordinator)
+    _patch_coordinator(
+        monkeypatch, "EntsoeGenerationForecastCoordinator", DummyCoordinator
     )
-    monkeypatch.setattr(
-        entsoe_init, "EntsoeWindSolarForecastCoordinator", DummyCoordinator
+    _patch_coordinator(
+        monkeypatch, "EntsoeWindSolarForecastCoordinator", DummyCoordinator
     )
 
     result = asyncio.run(entsoe_init.async_setup_entry(hass, entry))
@@ -155,3 +176,208 @@ def test_async_setup_entry_creates_additional_load_horizons(monkeypatch):
     assert europe.refresh_calls == 1
 
     assert hass.config_entries.async_forward_entry_setups.await_count == 1
+
+
+def test_async_setup_entry_runs_first_refreshes_concurrently(monkeypatch):
+    hass = SimpleNamespace()
+    hass.data = {}
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=AsyncMock(return_value=None)
+    )
+
+    options = {
+        CONF_API_KEY: "key",
+        CONF_AREA: "BE",
+        CONF_ENABLE_GENERATION: True,
+        CONF_ENABLE_LOAD: True,
+    }
+    entry = DummyEntry(options)
+
+    in_flight = 0
+    peak = 0
+
+    class SlowCoordinator(DummyCoordinator):
+        async def async_config_entry_first_refresh(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            await super().async_config_entry_first_refresh()
+
+    _patch_coordinator(monkeypatch, "EntsoeGenerationCoordinator", SlowCoordinator)
+    _patch_coordinator(monkeypatch, "EntsoeLoadCoordinator", SlowCoordinator)
+    _patch_coordinator(
+        monkeypatch, "EntsoeGenerationForecastCoordinator", SlowCoordinator
+    )
+    _patch_coordinator(
+        monkeypatch, "EntsoeWindSolarForecastCoordinator", SlowCoordinator
+    )
+
+    assert asyncio.run(entsoe_init.async_setup_entry(hass, entry)) is True
+
+    stored = hass.data[DOMAIN][entry.entry_id]
+    assert stored["generation"].refresh_calls == 1
+    assert stored["load"].refresh_calls == 1
+    assert peak >= 2
+
+
+def test_async_setup_entry_waits_for_all_refreshes_before_failing(monkeypatch):
+    hass = SimpleNamespace()
+    hass.data = {}
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=AsyncMock(return_value=None)
+    )
+
+    options = {
+        CONF_API_KEY: "key",
+        CONF_AREA: "BE",
+        CONF_ENABLE_GENERATION: True,
+        CONF_ENABLE_LOAD: True,
+    }
+    entry = DummyEntry(options)
+
+    class FailingCoordinator(DummyCoordinator):
+        async def async_config_entry_first_refresh(self):
+            raise RuntimeError("refresh failed")
+
+    created: list[DummyCoordinator] = []
+
+    def load_stub(hass, *, api_key, area, **kwargs):
+        coordinator = DummyCoordinator(hass, api_key=api_key, area=area, **kwargs)
+        created.append(coordinator)
+        return coordinator
+
+    _patch_coordinator(monkeypatch, "EntsoeGenerationCoordinator", FailingCoordinator)
+    _patch_coordinator(monkeypatch, "EntsoeLoadCoordinator", load_stub)
+    _patch_coordinator(
+        monkeypatch, "EntsoeGenerationForecastCoordinator", DummyCoordinator
+    )
+    _patch_coordinator(
+        monkeypatch, "EntsoeWindSolarForecastCoordinator", DummyCoordinator
+    )
+
+    with pytest.raises(RuntimeError, match="refresh failed"):
+        asyncio.run(entsoe_init.async_setup_entry(hass, entry))
+
+    assert created and all(coordinator.refresh_calls == 1 for coordinator in created)
+    assert all(coordinator.shutdown_calls == 1 for coordinator in created)
+    assert entry.entry_id not in hass.data[DOMAIN]
+    assert hass.config_entries.async_forward_entry_setups.await_count == 0
+
+
+def test_async_unload_entry_shuts_down_coordinators(monkeypatch):
+    hass = SimpleNamespace()
+    hass.data = {}
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=AsyncMock(return_value=None),
+        async_unload_platforms=AsyncMock(return_value=True),
+    )
+
+    options = {
+        CONF_API_KEY: "key",
+        CONF_AREA: "BE",
+        CONF_ENABLE_GENERATION: True,
+        CONF_ENABLE_LOAD: True,
+    }
+    entry = DummyEntry(options)
+
+    for name in (
+        "EntsoeGenerationCoordinator",
+        "EntsoeLoadCoordinator",
+        "EntsoeGenerationForecastCoordinator",
+        "EntsoeWindSolarForecastCoordinator",
+    ):
+        _patch_coordinator(monkeypatch, name, DummyCoordinator)
+
+    assert asyncio.run(entsoe_init.async_setup_entry(hass, entry)) is True
+    created = list(hass.data[DOMAIN][entry.entry_id].values())
+
+    assert asyncio.run(entsoe_init.async_unload_entry(hass, entry)) is True
+
+    assert created and all(coordinator.shutdown_calls == 1 for coordinator in created)
+    assert entry.entry_id not in hass.data[DOMAIN]
+
+
+def test_update_listener_reloads_only_when_options_change(monkeypatch):
+    hass = SimpleNamespace()
+    hass.data = {}
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=AsyncMock(return_value=None),
+        async_reload=AsyncMock(return_value=None),
+    )
+
+    options = {
+        CONF_API_KEY: "key",
+        CONF_AREA: "BE",
+        CONF_ENABLE_GENERATION: True,
+        CONF_ENABLE_LOAD: False,
+    }
+    entry = DummyEntry(dict(options))
+
+    for name in (
+        "EntsoeGenerationCoordinator",
+        "EntsoeLoadCoordinator",
+        "EntsoeGenerationForecastCoordinator",
+        "EntsoeWindSolarForecastCoordinator",
+    ):
+        _patch_coordinator(monkeypatch, name, DummyCoordinator)
+
+    assert asyncio.run(entsoe_init.async_setup_entry(hass, entry)) is True
+
+    asyncio.run(entry.update_listener(hass, entry))
+    assert hass.config_entries.async_reload.await_count == 0
+
+    entry.options = {**options, CONF_ENABLE_LOAD: True}
+    asyncio.run(entry.update_listener(hass, entry))
+    hass.config_entries.async_reload.assert_awaited_once_with(entry.entry_id)
+
+
+def test_async_setup_entry_skips_platforms_without_datasets():
+    hass = SimpleNamespace()
+    hass.data = {}
+    hass.config_entries = SimpleNamespace(
+        async_forward_entry_setups=AsyncMock(return_value=None),
+        async_unload_platforms=AsyncMock(return_value=True),
+    )
+
+    options = {CONF_API_KEY: "key", CONF_AREA: "BE"}
+    for spec in (
+        *entsoe_init._COORDINATOR_SPECS,
+        *entsoe_init._load_coordinator_specs(),
+    ):
+        options.update(dict.fromkeys(spec.option_keys, False))
+    entry = DummyEntry(options)
+
+    assert asyncio.run(entsoe_init.async_setup_entry(hass, entry)) is True
+    assert hass.data[DOMAIN][entry.entry_id] == {}
+    assert hass.config_entries.async_forward_entry_setups.await_count == 0
+    assert entry.update_listener is not None
+
+    assert asyncio.run(entsoe_init.async_unload_entry(hass, entry)) is True
+    assert hass.config_entries.async_unload_platforms.await_count == 0
+    assert entry.entry_id not in hass.data[DOMAIN]
+
+
+def test_load_horizon_europe_flag_honours_legacy_option():
+    from custom_components.entsoe_data.const import (
+        CONF_ENABLE_LOAD_TOTAL_EUROPE,
+        LOAD_FORECAST_HORIZONS,
+        option_enabled,
+    )
+
+    day_ahead = LOAD_FORECAST_HORIZONS[0]
+
+    def europe_enabled(options):
+        return option_enabled(
+            options, day_ahead.europe_option_keys, day_ahead.europe_default_enabled
+        )
+
+    assert europe_enabled({}) is day_ahead.europe_default_enabled
+    assert europe_enabled({CONF_ENABLE_LOAD_TOTAL_EUROPE: True}) is True
+    assert (
+        europe_enabled(
+            {CONF_ENABLE_LOAD_TOTAL_EUROPE: True, CONF_ENABLE_EUROPE_LOAD: False}
+        )
+        is False
+    )